@@ -0,0 +1,93 @@
+import os
+import gzip
+import time
+import threading
+import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+
+class PageArchive:
+    """Append-only archive of raw pages, WARC style
+
+    Each record is written as its own gzip member, so segment files can be
+    appended to safely and read back as one stream. Segments roll over once
+    they pass segment_bytes and are never rewritten.
+    """
+
+    def __init__(self, archive_dir: str = 'page_archive', segment_bytes: int = 64 * 1024 * 1024):
+        self.archive_dir = archive_dir
+        self.segment_bytes = segment_bytes
+        self.segment_path = None
+        self._lock = threading.Lock()
+        os.makedirs(archive_dir, exist_ok=True)
+
+    def _new_segment(self) -> str:
+        # Timestamp and pid keep names unique and sortable across processes
+        name = f"{datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%d%H%M%S%f')}-{os.getpid()}.warc.gz"
+        return os.path.join(self.archive_dir, name)
+
+    def append(self, url: str, platform: str, body: str, fetched_at: Optional[float] = None) -> None:
+        """Append one fetched page to the current segment"""
+        payload = body.encode('utf-8')
+        fetched = datetime.datetime.fromtimestamp(fetched_at or time.time(), datetime.timezone.utc)
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {fetched.strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+            f"WARC-Platform: {platform}\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "\r\n"
+        ).encode('utf-8')
+
+        record = gzip.compress(header + payload + b"\r\n\r\n")
+
+        # Scraper threads may share one archive
+        with self._lock:
+            if self.segment_path is None or os.path.getsize(self.segment_path) >= self.segment_bytes:
+                self.segment_path = self._new_segment()
+            with open(self.segment_path, 'ab') as f:
+                f.write(record)
+
+    def segments(self) -> List[str]:
+        """All segment files, oldest first"""
+        return sorted(
+            os.path.join(self.archive_dir, name)
+            for name in os.listdir(self.archive_dir)
+            if name.endswith('.warc.gz')
+        )
+
+    @staticmethod
+    def read_segment(path: str) -> Iterator[Dict[str, Any]]:
+        """Yield the records of one segment file in write order"""
+        with gzip.open(path, 'rb') as f:
+            while True:
+                line = f.readline()
+                if not line:
+                    break
+                if not line.startswith(b'WARC/'):
+                    continue
+
+                headers = {}
+                for line in iter(f.readline, b'\r\n'):
+                    if not line:
+                        break
+                    name, _, value = line.decode('utf-8').partition(':')
+                    headers[name.strip()] = value.strip()
+
+                body = f.read(int(headers.get('Content-Length', 0)))
+                f.read(4)  # record separator
+                yield {
+                    'url': headers.get('WARC-Target-URI'),
+                    'platform': headers.get('WARC-Platform'),
+                    'fetched_at': headers.get('WARC-Date'),
+                    'body': body.decode('utf-8')
+                }
+
+    def iter_records(self, platform: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every archived record, optionally for one platform only"""
+        for path in self.segments():
+            for record in self.read_segment(path):
+                if platform is None or record['platform'] == platform:
+                    yield record
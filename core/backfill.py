@@ -0,0 +1,55 @@
+from multiprocessing import Pool
+from typing import Dict, Any, List, Tuple, Type, Optional
+
+from .archive import PageArchive
+from .base_scraper import BasePlatformScraper
+from .database import DatabaseManager
+
+
+def _extract_segment(args: Tuple[str, str, Type[BasePlatformScraper]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Worker: re-run detail extraction over every record of one segment"""
+    segment_path, platform, scraper_class = args
+    scraper = scraper_class()
+    results = []
+
+    for record in PageArchive.read_segment(segment_path):
+        if record['platform'] != platform:
+            continue
+        try:
+            results.append((record['url'], scraper.parse_detail_page(record['body'], record['url'])))
+        except Exception as e:
+            print(f"Error re-extracting {record['url']}: {e}")
+
+    return results
+
+
+def backfill_from_archive(scraper_class: Type[BasePlatformScraper], platform: str,
+                          archive_dir: str = 'page_archive', db_name: Optional[str] = None,
+                          workers: Optional[int] = None, batch_size: int = 1000) -> int:
+    """Re-extract archived detail pages and bulk update the stored jobs
+
+    Segments are parsed in parallel but applied in archive order, so the
+    most recent capture of a page wins. Returns the number of jobs updated.
+    """
+    archive = PageArchive(archive_dir)
+    db_manager = DatabaseManager(db_name or f'{platform}_jobs.db')
+    tasks = [(path, platform, scraper_class) for path in archive.segments()]
+    print(f"Re-extracting {len(tasks)} archive segments for {platform}")
+
+    updated = 0
+    pending = []
+    try:
+        with Pool(workers) as pool:
+            for results in pool.imap(_extract_segment, tasks):
+                pending.extend(results)
+                if len(pending) >= batch_size:
+                    updated += db_manager.update_job_details(platform, pending)
+                    pending = []
+
+        if pending:
+            updated += db_manager.update_job_details(platform, pending)
+    finally:
+        db_manager.close()
+
+    print(f"Updated {updated} jobs from archive")
+    return updated
@@ -1,5 +1,11 @@
+import os
+import tempfile
+from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
+
+from .models import Job
+from .page_cache import CacheMissError
 
 class BasePlatformScraper(ABC):
     """Abstract base class for platform-specific scrapers"""
@@ -7,6 +13,16 @@ class BasePlatformScraper(ABC):
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.driver = None
+        self.page_cache = None
+        self.page_archive = None
+        # Set by the orchestrator so scrapers can skip known company details
+        self.company_cache = None
+        self._cached_page_file = None
+        # Results one search can page through before the platform stops; None is unlimited
+        self.result_cap = None
+        self.results_per_page = 10
+        # (search param, values) that partition a search, in splitting order
+        self.shard_dimensions = []
     
     @abstractmethod
     def setup_driver(self) -> None:
@@ -24,7 +40,7 @@ class BasePlatformScraper(ABC):
         pass
 
     @abstractmethod
-    def extract_basic_job_info(self, job_element: Any) -> Dict[str, Any]:
+    def extract_basic_job_info(self, job_element: Any) -> Job:
         """Extract basic job info from job listing element"""
         pass
 
@@ -43,7 +59,110 @@ class BasePlatformScraper(ABC):
         """Navigate to the next page"""
         pass
 
+    def extract_listing_page(self) -> List[Job]:
+        """Basic info of every new listing on the current page
+
+        Lets the orchestrator dedupe and filter a whole page before fetching
+        any details. Platforms can override this to read all cards in one
+        driver call; the default extracts them one element at a time.
+        """
+        return [self.extract_basic_job_info(job_element) for job_element in self.get_job_elements()]
+
+    def parse_detail_page(self, html: str, url: Optional[str] = None) -> Dict[str, Any]:
+        """Extract detail fields from raw job page HTML, without a driver
+
+        Used to re-extract archived pages offline. Platforms that support it
+        return the same fields as extract_detailed_job_info. url is the page
+        address, to resolve relative links against.
+        """
+        raise NotImplementedError(f"{self.platform_name} does not support offline extraction")
+
+    def effective_search_params(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """search_params with the platform's defaults filled in
+
+        SearchPlanner splits this rather than the raw params, so that shards
+        narrow the search the platform would really run.
+        """
+        return dict(search_params)
+
+    def count_results(self, search_params: Dict[str, Any]) -> Optional[int]:
+        """Total number of results of a search, or None if the platform does not show it
+
+        Used by SearchPlanner to split searches that hit the result cap.
+        """
+        return None
+
+    def company_board_url(self, company_url: str) -> str:
+        """URL of the machine-readable job board of a company
+
+        Boards are fetched over plain HTTP by CompanyBoardCrawler, without a
+        driver. Raises ValueError for URLs that are not company boards.
+        """
+        raise NotImplementedError(f"{self.platform_name} does not support company boards")
+
+    def parse_company_board(self, body: str, company_url: str) -> List[Job]:
+        """Jobs listed in a fetched company board, with their detail fields
+
+        Must not touch the driver: boards are parsed concurrently.
+        """
+        raise NotImplementedError(f"{self.platform_name} does not support company boards")
+
+    def open_page(self, url: str, ready: Optional[Callable[[], Any]] = None,
+                  archive: bool = False) -> bool:
+        """Load url in the driver, going through the page cache when one is set
+
+        ready is called once the page is loaded, e.g. to wait for an element,
+        and must return before a freshly fetched page is cached or archived.
+        Returns True if the page came from the cache.
+        """
+        cache = self.page_cache
+        if cache is not None:
+            entry = cache.get(url, self.platform_name)
+            if entry is None and not cache.cache_only and cache.revalidate(url, self.platform_name):
+                entry = cache.get(url, self.platform_name)
+
+            if entry is not None:
+                self._load_cached_page(url, entry['body'])
+                if ready:
+                    ready()
+                return True
+
+            if cache.cache_only:
+                raise CacheMissError(f"Page not cached: {url}")
+
+        self.driver.get(url)
+        if ready:
+            ready()
+        if cache is not None or (archive and self.page_archive is not None):
+            page_source = self.driver.page_source
+            if cache is not None:
+                cache.put(url, self.platform_name, page_source)
+            if archive and self.page_archive is not None:
+                self.page_archive.append(url, self.platform_name, page_source)
+        return False
+
+    def _load_cached_page(self, url: str, body: str) -> None:
+        """Render a cached page body from a local file"""
+        if self._cached_page_file is None:
+            fd, self._cached_page_file = tempfile.mkstemp(suffix='.html')
+            os.close(fd)
+
+        # Resolve relative links against the original URL
+        base = f'<base href="{url}">'
+        if '<head>' in body:
+            body = body.replace('<head>', '<head>' + base, 1)
+        else:
+            body = base + body
+
+        with open(self._cached_page_file, 'w', encoding='utf-8') as f:
+            f.write(body)
+        self.driver.get(Path(self._cached_page_file).as_uri())
+
     def cleanup(self):
         """clean up resources"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
+        if self._cached_page_file:
+            os.remove(self._cached_page_file)
+            self._cached_page_file = None
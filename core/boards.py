@@ -0,0 +1,170 @@
+import time
+import hashlib
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Optional, Tuple
+
+from .base_scraper import BasePlatformScraper
+from .companies import CompanyCache
+from .filters import JobFilter
+from .store import JobStore
+
+
+class CompanyBoardCrawler:
+    """Incremental crawl of many company career boards
+
+    Boards are fetched over plain HTTP through the scraper's company board
+    API, so no browser is needed. Every board keeps its ETag, Last-Modified,
+    body hash and the job URLs seen last time in the company_boards table:
+    unchanged boards cost one conditional request (a 304, or a body whose
+    hash matches) and only jobs not seen before are inserted. A board lists
+    all open jobs of its company, so known jobs missing from it are expired.
+
+    Boards are crawled concurrently, with at most per_host requests in
+    flight against any one host; 429 and 503 responses are retried after
+    their Retry-After delay.
+    """
+
+    def __init__(self, platform_scrapper: BasePlatformScraper, store: JobStore,
+                 concurrency: int = 16, per_host: int = 8, timeout: float = 15.0,
+                 max_retries: int = 3, job_filter: Optional[JobFilter] = None,
+                 company_cache: Optional[CompanyCache] = None):
+        self.scraper = platform_scrapper
+        self.store = store
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.job_filter = job_filter
+        self.company_cache = company_cache or CompanyCache(store)
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            'boards': 0,
+            'unchanged': 0,
+            'changed': 0,
+            'errors': 0,
+            'new_jobs': 0,
+            'expired_jobs': 0,
+            'filtered_out': 0
+        }
+
+    def crawl(self, company_urls: List[str]) -> Dict[str, int]:
+        """Check every board once and insert the jobs not seen before"""
+        self.reset_stats()
+        start = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for status, new_jobs, expired_jobs, filtered_out in executor.map(self.crawl_board, company_urls):
+                self.stats['boards'] += 1
+                self.stats[status] += 1
+                self.stats['new_jobs'] += new_jobs
+                self.stats['expired_jobs'] += expired_jobs
+                self.stats['filtered_out'] += filtered_out
+
+        self._print_stats(time.time() - start)
+        return self.stats
+
+    def crawl_board(self, company_url: str) -> Tuple[str, int, int, int]:
+        """Crawl one board; returns (status, new jobs, expired jobs, jobs filtered out)"""
+        platform = self.scraper.platform_name
+        try:
+            board_url = self.scraper.company_board_url(company_url)
+            state = self.store.get_board_state(platform, company_url) or {}
+
+            seen = set(state.get('job_ids', []))
+
+            response = self._fetch(board_url, state)
+            if response is not None:
+                body, etag, last_modified = response
+                body_hash = hashlib.sha256(body).hexdigest()
+            if response is None or body_hash == state.get('body_hash'):
+                if seen:
+                    self.store.mark_seen(platform, list(seen))
+                self.store.save_board_state(platform, company_url)
+                return 'unchanged', 0, 0, 0
+
+            jobs = self.scraper.parse_company_board(body.decode('utf-8'), company_url)
+            known_jobs = []
+            new_jobs = []
+            filtered_out = 0
+            for job in jobs:
+                if job.url in seen or self.store.job_exists(job.url, platform):
+                    known_jobs.append(job)
+                    continue
+                if self.job_filter and not self.job_filter.filter_job(job):
+                    filtered_out += 1
+                    continue
+                self.company_cache.resolve(job)
+                new_jobs.append(job)
+
+            if known_jobs:
+                self.store.refresh_jobs(known_jobs)
+            gone = seen - {job.url for job in jobs}
+            expired = self.store.expire_jobs(platform, list(gone)) if gone else 0
+
+            inserted = self.store.insert_jobs(new_jobs) if new_jobs else 0
+            # Keep the old state if the insert failed so the jobs are retried
+            if inserted == len(new_jobs):
+                self.store.save_board_state(platform, company_url, etag=etag,
+                                            last_modified=last_modified, body_hash=body_hash,
+                                            job_ids=[job.url for job in jobs])
+            return 'changed', inserted, expired, filtered_out
+
+        except Exception as e:
+            print(f"Error crawling board {company_url}: {e}")
+            return 'errors', 0, 0, 0
+
+    def _fetch(self, url: str, state: Dict[str, Any]) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+        """Conditional GET of a board; returns None if it is unchanged"""
+        headers = {'Accept': 'application/json'}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+        request = urllib.request.Request(url, headers=headers)
+        for attempt in range(self.max_retries + 1):
+            with self._host_slot(url):
+                try:
+                    with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                        return (response.read(), response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
+                except urllib.error.HTTPError as e:
+                    if e.code == 304:
+                        return None
+                    if e.code not in (429, 503) or attempt == self.max_retries:
+                        raise
+                    # Back off while still holding the slot, slowing the whole host down
+                    time.sleep(_retry_after(e.headers.get('Retry-After'), attempt))
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore limiting concurrent requests to the host of url"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _print_stats(self, elapsed: float):
+        """print crawl statistics"""
+        print("\n" + "="*50)
+        print(f"BOARD CRAWL STATISTICS - {self.scraper.platform_name} ({elapsed:.1f}s)")
+        print("="*50)
+        for key, value in self.stats.items():
+            print(f"{key.replace('_', ' ').title()}: {value}")
+        print("="*50)
+
+
+def _retry_after(value: Optional[str], attempt: int) -> float:
+    """Seconds to wait before a retry, from a Retry-After header if it has them"""
+    try:
+        return min(float(value), 60.0)
+    except (TypeError, ValueError):
+        return 2.0 ** attempt
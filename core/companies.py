@@ -0,0 +1,100 @@
+import os
+import time
+import hashlib
+import mimetypes
+import threading
+import urllib.request
+import urllib.error
+from typing import Dict, Any, Optional, Tuple
+
+from .models import Job
+
+
+class CompanyCache:
+    """In-memory cache in front of the companies table
+
+    Company details (apply URL, logo) are stored once per company and jobs
+    only keep a company_id. While a company record is younger than ttl the
+    scraper can skip extracting those details again. With logo_dir set,
+    logos are downloaded once and stored by content hash, so companies
+    sharing an image share one file.
+    """
+
+    def __init__(self, db_manager, ttl: float = 7 * 24 * 3600, logo_dir: Optional[str] = None):
+        self.db_manager = db_manager
+        self.ttl = ttl
+        self.logo_dir = logo_dir
+        self._companies: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if logo_dir:
+            os.makedirs(logo_dir, exist_ok=True)
+
+    def get(self, platform: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return the company record, loading it from the database once"""
+        key = (platform, name)
+        with self._lock:
+            if key in self._companies:
+                return self._companies[key]
+
+        company = self.db_manager.get_company(platform, name)
+        if company is not None:
+            with self._lock:
+                self._companies[key] = company
+        return company
+
+    def is_fresh(self, platform: str, name: str) -> bool:
+        """True if the company details were fetched within the TTL"""
+        company = self.get(platform, name)
+        return company is not None and time.time() - (company['fetched_at'] or 0) < self.ttl
+
+    def resolve(self, job: Job) -> Optional[int]:
+        """Point a job at its company record, creating or refreshing it as needed
+
+        The company URL and logo move to the company record, so they are
+        cleared on the job row.
+        """
+        if not job.company:
+            return None
+
+        if not self.is_fresh(job.platform, job.company) and (job.company_url or job.company_logo):
+            logo_hash, logo_path = self._store_logo(job.company_logo)
+            self.db_manager.upsert_company(
+                job.platform, job.company, url=job.company_url, logo_url=job.company_logo,
+                logo_hash=logo_hash, logo_path=logo_path
+            )
+            with self._lock:
+                self._companies.pop((job.platform, job.company), None)
+
+        company = self.get(job.platform, job.company)
+        if company is None:
+            company_id = self.db_manager.upsert_company(job.platform, job.company)
+        else:
+            company_id = company['id']
+
+        job.company_id = company_id
+        job.company_url = None
+        job.company_logo = None
+        return company_id
+
+    def _store_logo(self, logo_url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Download a logo into logo_dir, deduplicated by content hash"""
+        if not self.logo_dir or not logo_url:
+            return None, None
+
+        try:
+            with urllib.request.urlopen(logo_url, timeout=10) as response:
+                data = response.read()
+                content_type = response.headers.get_content_type()
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            print(f"Error downloading logo {logo_url}: {e}")
+            return None, None
+
+        logo_hash = hashlib.sha256(data).hexdigest()
+        extension = mimetypes.guess_extension(content_type) or ''
+        logo_path = os.path.join(self.logo_dir, logo_hash + extension)
+        if not os.path.exists(logo_path):
+            with open(logo_path, 'wb') as f:
+                f.write(data)
+
+        return logo_hash, logo_path
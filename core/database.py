@@ -1,15 +1,65 @@
 # Scrapper Core
-import sqlite3
 import json
-from typing import Dict, Any
+import sqlite3
+from typing import Dict, Any, List, Optional, Tuple, Union, Set
+
+from .descriptions import flatten_sections, description_text, load_description
+from .models import Job
+from .salary import SalaryNormalizer
+from .skills import SkillMatcher, default_matcher
+
+
+# Detail fields a backfill may overwrite, mapped to their jobs columns. Dates
+# are left alone: relative "Posted 3 days ago" text is only valid at crawl time.
+BACKFILL_COLUMNS = {'title': 'job_title', 'location': 'location', 'job_type': 'job_type'}
+
+# Salaries converted to annual base-currency amounts, see SalaryNormalizer
+SALARY_BASE_COLUMNS = ('salary_min_base', 'salary_max_base')
+# Best annual amount a job offers; open-ended ranges ("$100k+") only have a minimum.
+# Queries must use this exact text to match idx_jobs_salary_base.
+SALARY_BEST_BASE_SQL = 'COALESCE(salary_max_base, salary_min_base)'
+
+INSERT_JOB_SQL = f'''
+    INSERT INTO jobs ({', '.join(Job.DB_COLUMNS + SALARY_BASE_COLUMNS)}, last_seen)
+    VALUES ({', '.join('?' * (len(Job.DB_COLUMNS) + len(SALARY_BASE_COLUMNS)))}, CURRENT_TIMESTAMP)
+'''
+
+# Job snapshot stored with each change event
+EVENT_PAYLOAD_SQL = '''
+    json_object('platform', platform, 'url', url, 'title', job_title, 'company', company,
+                'location', location, 'job_type', job_type, 'salary', salary,
+                'salary_min_base', salary_min_base, 'salary_max_base', salary_max_base,
+                'post_date', post_date, 'last_seen', last_seen, 'expired_at', expired_at)
+'''
+
+# Dimensions of the job_stats rollup, mapped to their value expression over
+# a jobs row; {row} is new or old inside the triggers and jobs in rebuilds
+STATS_DIMENSIONS = {
+    'company': '{row}.company',
+    'location': '{row}.location',
+    'job_type': '{row}.job_type',
+    'day': 'date({row}.scrapped_at)',
+}
+
+# Listing fields compared when a crawl sees a known job again
+REFRESH_FIELDS = {'title': 'job_title', 'location': 'location', 'job_type': 'job_type', 'salary': 'salary'}
 
 
 class DatabaseManager:
     """Handles all database operations - platform agnostic
     """
 
-    def __init__(self, db_name= 'job_scrapper.db'):
+    def __init__(self, db_name= 'job_scrapper.db', timeout: float = 30.0,
+                 check_same_thread: bool = True, skill_matcher: Optional[SkillMatcher] = None,
+                 salary_normalizer: Optional[SalaryNormalizer] = None):
         self.db_name = db_name
+        # Skills are extracted into job_skills as jobs are inserted
+        self.skill_matcher = skill_matcher or default_matcher()
+        # Salary text is parsed into numeric columns as jobs are inserted
+        self.salary_normalizer = salary_normalizer or SalaryNormalizer()
+        # Seconds to wait on a locked database before raising "database is locked"
+        self.timeout = timeout
+        self.check_same_thread = check_same_thread
         self.conn = None
         self.cursor = None
         self.init_db()
@@ -18,7 +68,16 @@ class DatabaseManager:
         """Initialize the SQLite database and create a table if table
             doesnt exist
         """
-        self.conn = sqlite3.connect(self.db_name)
+        # Larger statement cache so the query layer reuses its prepared statements
+        self.conn = sqlite3.connect(self.db_name, timeout=self.timeout,
+                                    check_same_thread=self.check_same_thread,
+                                    cached_statements=256)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        # Only takes effect on a new file; RetentionManager converts old ones
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets readers run alongside the writer, in other threads and processes
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
         self.cursor = self.conn.cursor()
 
         # Job table structure
@@ -40,47 +99,704 @@ class DatabaseManager:
                 raw_data TEXT
             )
         ''')
+
+        # Company metadata, stored once per company and referenced by jobs
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS companies (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                platform TEXT NOT NULL,
+                name TEXT NOT NULL,
+                url TEXT,
+                logo_url TEXT,
+                logo_hash TEXT,
+                logo_path TEXT,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (platform, name)
+            )
+        ''')
+        self._ensure_column('jobs', 'company_id', 'INTEGER REFERENCES companies(id)')
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs (company_id)")
+
+        # Parsed salary range, plus the same range as an annual amount in the
+        # normalizer's base currency so jobs can be compared and filtered in SQL
+        for column, definition in (('salary_min', 'REAL'), ('salary_max', 'REAL'),
+                                   ('salary_currency', 'TEXT'), ('salary_period', 'TEXT'),
+                                   ('salary_min_base', 'REAL'), ('salary_max_base', 'REAL')):
+            self._ensure_column('jobs', column, definition)
+        self.cursor.execute("DROP INDEX IF EXISTS idx_jobs_salary_max_base")
+        self.cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_jobs_salary_base ON jobs ({SALARY_BEST_BASE_SQL})")
+
+        # When a crawl last saw each job, and when it disappeared from its board
+        self._ensure_column('jobs', 'last_seen', 'TIMESTAMP')
+        self._ensure_column('jobs', 'expired_at', 'TIMESTAMP')
+
+        # Jobs moved to the monthly archives by RetentionManager, kept for dedupe
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS archived_jobs (
+                url TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                archive TEXT NOT NULL,
+                PRIMARY KEY (url, platform)
+            ) WITHOUT ROWID
+        ''')
+
+        # Append-only change outbox; seq only grows, so consumers resume from
+        # the last seq they processed instead of rescanning jobs
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER NOT NULL,
+                event TEXT NOT NULL,
+                payload TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Skills found in each job, keyed for "jobs needing X and Y" lookups
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_skills (
+                skill TEXT NOT NULL,
+                job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+                PRIMARY KEY (skill, job_id)
+            ) WITHOUT ROWID
+        ''')
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_skills_job ON job_skills (job_id)")
+
+        # Incremental crawl state of company career boards
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS company_boards (
+                platform TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                job_ids TEXT,
+                checked_at TIMESTAMP,
+                changed_at TIMESTAMP,
+                PRIMARY KEY (platform, url)
+            )
+        ''')
+
+        # Access paths for dedupe and the read-side query layer. Listing
+        # queries page on (scrapped_at, id); the platform index also covers
+        # the listing columns so those pages never touch the table itself.
+        self.cursor.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_jobs_url_platform ON jobs (url, platform);
+            CREATE INDEX IF NOT EXISTS idx_jobs_scrapped ON jobs (scrapped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_platform_listing
+                ON jobs (platform, scrapped_at, id, job_title, company, location, job_type, url);
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company, scrapped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location, scrapped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_job_type ON jobs (job_type, scrapped_at, id);
+        ''')
+
+        # Structured description sections, one row per paragraph or list item
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_sections (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+                section TEXT NOT NULL,
+                type TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                content TEXT NOT NULL
+            )
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_sections_job
+            ON job_sections (job_id, section, position)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_sections_section
+            ON job_sections (section, job_id)
+        ''')
+        self.fts_enabled = self._init_sections_fts()
+        self._init_job_stats()
         self.conn.commit()
-    
-    
-    def insert_job(self, job_info: Dict[str, Any]):
-        """Insert job record into the database"""
+
+    def _ensure_column(self, table: str, column: str, definition: str):
+        """Add a column to a table created by an older version of the schema"""
+        columns = [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+        if column not in columns:
+            self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def _init_sections_fts(self) -> bool:
+        """Create the full-text index over section content if FTS5 is available"""
         try:
             self.cursor.execute('''
-                INSERT INTO jobs (platform, job_title, company, 
-                                location, job_type, salary, description, 
-                                requirements, post_date, url, company_logo, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_info['platform'],
-                job_info['title'],
-                job_info['company'],
-                job_info['location'],
-                job_info['job_type'],
-                job_info['salary'],
-                job_info['description'],
-                job_info['requirements'],
-                job_info['post_date'],
-                job_info['url'],
-                job_info['company_logo'],
-                json.dumps(job_info.get('raw_data', {}))
-            ))
+                CREATE VIRTUAL TABLE IF NOT EXISTS job_sections_fts
+                USING fts5(content, content='job_sections', content_rowid='id')
+            ''')
+        except sqlite3.OperationalError:
+            return False
+
+        # Keep the external content index in step with the sections table
+        self.cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS job_sections_ai AFTER INSERT ON job_sections BEGIN
+                INSERT INTO job_sections_fts (rowid, content) VALUES (new.id, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS job_sections_ad AFTER DELETE ON job_sections BEGIN
+                INSERT INTO job_sections_fts (job_sections_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END;
+        ''')
+        return True
+
+    def _init_job_stats(self):
+        """Create the job_stats rollup and the triggers that keep it current
+
+        Every write to jobs adjusts the counts of its company, location, job
+        type and scrape day within the same transaction, so dashboards read
+        a few rows instead of grouping the whole table. A rollup added to an
+        existing database is filled once from the jobs already stored.
+        """
+        created = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_stats'"
+        ).fetchone() is None
+
+        # value is '' for jobs missing the field; active excludes expired jobs
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_stats (
+                dimension TEXT NOT NULL,
+                value TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                jobs INTEGER NOT NULL DEFAULT 0,
+                active INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, value, platform)
+            ) WITHOUT ROWID
+        ''')
+
+        changed = ' OR '.join(
+            f"{expression.format(row='old')} IS NOT {expression.format(row='new')}"
+            for expression in list(STATS_DIMENSIONS.values()) + ['{row}.platform']
+        )
+        self.cursor.executescript(f'''
+            CREATE TRIGGER IF NOT EXISTS job_stats_ai AFTER INSERT ON jobs BEGIN
+                {_stats_upsert('new', 1)}
+            END;
+            CREATE TRIGGER IF NOT EXISTS job_stats_ad AFTER DELETE ON jobs BEGIN
+                {_stats_upsert('old', -1)}
+            END;
+            CREATE TRIGGER IF NOT EXISTS job_stats_au AFTER UPDATE
+                OF platform, company, location, job_type, scrapped_at, expired_at ON jobs
+                WHEN {changed}
+                    OR (old.expired_at IS NULL) IS NOT (new.expired_at IS NULL) BEGIN
+                {_stats_upsert('old', -1)}
+                {_stats_upsert('new', 1)}
+            END;
+        ''')
+
+        if created and self.conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone():
+            self.rebuild_job_stats()
+
+    def rebuild_job_stats(self) -> int:
+        """Recount job_stats from the jobs table, e.g. after restoring a backup
+
+        Returns the number of rollup rows written.
+        """
+        try:
+            self.cursor.execute("DELETE FROM job_stats")
+            for dimension, expression in STATS_DIMENSIONS.items():
+                value = expression.format(row='jobs')
+                self.cursor.execute(f'''
+                    INSERT INTO job_stats (dimension, value, platform, jobs, active)
+                    SELECT ?, COALESCE({value}, ''), COALESCE(platform, ''),
+                           COUNT(*), SUM(expired_at IS NULL)
+                    FROM jobs GROUP BY 2, 3
+                ''', (dimension,))
+            rows = self.conn.execute("SELECT COUNT(*) FROM job_stats").fetchone()[0]
             self.conn.commit()
-            return True
+            return rows
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-            return False
-    
+            self.conn.rollback()
+            return 0
+
+    def insert_job(self, job: Union[Job, Dict[str, Any]]):
+        """Insert job record into the database"""
+        return self.insert_jobs([job]) == 1
+
+    def insert_jobs(self, jobs: List[Union[Job, Dict[str, Any]]]) -> int:
+        """Insert a batch of job records in a single transaction
+
+        Legacy job_info dicts are converted to Job records. Returns the
+        number of jobs inserted; on a database error the whole batch is rolled
+        back and 0 returned, other errors roll back and are re-raised.
+        """
+        try:
+            for job in jobs:
+                if isinstance(job, dict):
+                    job = Job.from_dict(job)
+                self.salary_normalizer.apply(job)
+                self.cursor.execute(INSERT_JOB_SQL,
+                                    job.to_db_params() + self.salary_normalizer.base_range(job))
+                job_id = self.cursor.lastrowid
+                self.record_event(job_id, 'new')
+                self.insert_job_sections(job_id, job.description)
+                self.insert_job_skills(job_id, self.skill_matcher.extract(
+                    _skill_text(job.title, description_text(job.description), job.requirements)
+                ))
+            self.conn.commit()
+            return len(jobs)
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            self.conn.rollback()
+            return 0
+        except Exception:
+            # e.g. unserializable raw_data; don't leave half the batch in the transaction
+            self.conn.rollback()
+            raise
+
+    def insert_job_sections(self, job_id: int, description: Any):
+        """Bulk insert the structured sections of a job description
+
+        The caller owns the transaction; nothing is committed here.
+        """
+        rows = [(job_id,) + row for row in flatten_sections(description)]
+        if rows:
+            self.cursor.executemany('''
+                INSERT INTO job_sections (job_id, section, type, position, content)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+
+    def insert_job_skills(self, job_id: int, skills):
+        """Bulk insert the skills of a job; the caller owns the transaction"""
+        if skills:
+            self.cursor.executemany(
+                "INSERT OR IGNORE INTO job_skills (skill, job_id) VALUES (?, ?)",
+                [(skill, job_id) for skill in skills]
+            )
+
+    def backfill_job_skills(self, batch_size: int = 1000) -> int:
+        """Re-extract the skills of every stored job with the current taxonomy
+
+        Existing job_skills rows are replaced, so taxonomy changes apply to
+        old jobs too. Returns the number of jobs processed.
+        """
+        processed = 0
+        last_id = 0
+
+        while True:
+            rows = self.conn.execute('''
+                SELECT id, job_title, description, requirements FROM jobs
+                WHERE id > ? ORDER BY id LIMIT ?
+            ''', (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+
+            job_ids = [(row[0],) for row in rows]
+            skill_rows = [
+                (skill, job_id)
+                for job_id, title, description, requirements in rows
+                for skill in self.skill_matcher.extract(_skill_text(title, description, requirements))
+            ]
+            self.cursor.executemany("DELETE FROM job_skills WHERE job_id = ?", job_ids)
+            self.cursor.executemany(
+                "INSERT OR IGNORE INTO job_skills (skill, job_id) VALUES (?, ?)", skill_rows
+            )
+            self.conn.commit()
+
+            last_id = rows[-1][0]
+            processed += len(rows)
+
+        return processed
+
+    def backfill_salaries(self, batch_size: int = 1000) -> int:
+        """Re-parse the salary text of every stored job
+
+        Run it after changing the exchange rates or the parser. Returns the
+        number of jobs processed.
+        """
+        processed = 0
+        last_id = 0
+
+        while True:
+            rows = self.conn.execute('''
+                SELECT id, platform, salary FROM jobs
+                WHERE id > ? ORDER BY id LIMIT ?
+            ''', (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+
+            params = []
+            for job_id, platform, salary in rows:
+                job = Job(platform=platform, salary=salary)
+                self.salary_normalizer.apply(job)
+                params.append((job.salary_min, job.salary_max, job.salary_currency, job.salary_period)
+                              + self.salary_normalizer.base_range(job) + (job_id,))
+            self.cursor.executemany('''
+                UPDATE jobs SET salary_min = ?, salary_max = ?, salary_currency = ?,
+                    salary_period = ?, salary_min_base = ?, salary_max_base = ?
+                WHERE id = ?
+            ''', params)
+            self.conn.commit()
+
+            last_id = rows[-1][0]
+            processed += len(rows)
+
+        return processed
+
+    def migrate_description_sections(self, batch_size: int = 500) -> int:
+        """Move legacy JSON description blobs into the job_sections table"""
+        migrated = 0
+        last_id = 0
+
+        while True:
+            rows = self.conn.execute('''
+                SELECT id, description FROM jobs
+                WHERE id > ? AND description LIKE '{%'
+                ORDER BY id LIMIT ?
+            ''', (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+
+            for job_id, description in rows:
+                last_id = job_id
+                data = load_description(description)
+                if data is None:
+                    continue
+                self.cursor.execute("DELETE FROM job_sections WHERE job_id = ?", (job_id,))
+                self.insert_job_sections(job_id, data)
+                self.cursor.execute(
+                    "UPDATE jobs SET description = ? WHERE id = ?",
+                    (description_text(data), job_id)
+                )
+                migrated += 1
+            self.conn.commit()
+
+        return migrated
+
+    def update_job_details(self, platform: str, updates: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Bulk update re-extracted detail fields of existing jobs
+
+        updates is a list of (url, detailed_info) pairs; all of them are
+        written in one transaction. Returns the number of jobs updated.
+        """
+        updated = 0
+        try:
+            for url, detailed_info in updates:
+                job_ids = [row[0] for row in self.conn.execute(
+                    "SELECT id FROM jobs WHERE url = ? AND platform = ?", (url, platform)
+                )]
+                description = detailed_info.get('description')
+                columns = [(column, detailed_info[key]) for key, column in BACKFILL_COLUMNS.items()
+                           if detailed_info.get(key)]
+                for job_id in job_ids:
+                    if columns:
+                        self.cursor.execute(
+                            f"UPDATE jobs SET {', '.join(column + ' = ?' for column, _ in columns)} WHERE id = ?",
+                            [value for _, value in columns] + [job_id]
+                        )
+                    if description is not None:
+                        self.cursor.execute("DELETE FROM job_sections WHERE job_id = ?", (job_id,))
+                        self.insert_job_sections(job_id, description)
+                        self.cursor.execute(
+                            "UPDATE jobs SET description = ? WHERE id = ?",
+                            (description_text(description), job_id)
+                        )
+                        # Requirements are derived from the description, keep them in step
+                        if 'requirements' in detailed_info:
+                            self.cursor.execute(
+                                "UPDATE jobs SET requirements = ? WHERE id = ?",
+                                (_requirements_text(detailed_info['requirements']), job_id)
+                            )
+
+                        # Re-extracted text may mention different skills
+                        title, requirements = self.conn.execute(
+                            "SELECT job_title, requirements FROM jobs WHERE id = ?", (job_id,)
+                        ).fetchone()
+                        self.cursor.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+                        self.insert_job_skills(job_id, self.skill_matcher.extract(
+                            _skill_text(title, description_text(description), requirements)
+                        ))
+                    if columns or description is not None:
+                        self.record_event(job_id, 'updated')
+                    updated += 1
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            self.conn.rollback()
+            return 0
+
+        return updated
+
+    def record_event(self, job_id: int, event: str):
+        """Append a new/updated/expired event to the outbox; the caller owns the transaction"""
+        self.cursor.execute(f'''
+            INSERT INTO job_events (job_id, event, payload)
+            SELECT id, ?, {EVENT_PAYLOAD_SQL} FROM jobs WHERE id = ?
+        ''', (event, job_id))
+
+    def mark_seen(self, platform: str, urls: List[str]) -> int:
+        """Set last_seen on known jobs a crawl came across again
+
+        A job that had expired and shows up again is revived with an
+        'updated' event. Returns the number of jobs touched.
+        """
+        return self.refresh_jobs([Job(platform=platform, url=url) for url in urls])
+
+    def refresh_jobs(self, jobs: List[Job]) -> int:
+        """Set last_seen on known jobs and store changed listing fields
+
+        Only fields set on the Job are compared; a change, or a job coming
+        back after it expired, is recorded as an 'updated' event. Returns the
+        number of jobs touched.
+        """
+        touched = 0
+        try:
+            for job in jobs:
+                rows = self.conn.execute(f'''
+                    SELECT id, expired_at, {', '.join(REFRESH_FIELDS.values())}
+                    FROM jobs WHERE url = ? AND platform = ?
+                ''', (job.url, job.platform)).fetchall()
+                for row in rows:
+                    job_id, expired_at, stored = row[0], row[1], dict(zip(REFRESH_FIELDS.values(), row[2:]))
+                    changes = [(column, getattr(job, field)) for field, column in REFRESH_FIELDS.items()
+                               if getattr(job, field) is not None and getattr(job, field) != stored[column]]
+                    if any(column == 'salary' for column, _ in changes):
+                        changes += self._salary_columns(job.salary)
+                    self.cursor.execute(
+                        f"UPDATE jobs SET {''.join(column + ' = ?, ' for column, _ in changes)}"
+                        "last_seen = CURRENT_TIMESTAMP, expired_at = NULL WHERE id = ?",
+                        [value for _, value in changes] + [job_id]
+                    )
+                    if changes or expired_at is not None:
+                        self.record_event(job_id, 'updated')
+                    touched += 1
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            self.conn.rollback()
+            return 0
+
+        return touched
+
+    def _salary_columns(self, salary: str) -> List[Tuple[str, Any]]:
+        """Parsed and base-currency salary columns for changed salary text"""
+        parsed = Job(platform='', salary=salary)
+        self.salary_normalizer.apply(parsed)
+        return list(zip(('salary_min', 'salary_max', 'salary_currency', 'salary_period') + SALARY_BASE_COLUMNS,
+                        (parsed.salary_min, parsed.salary_max, parsed.salary_currency, parsed.salary_period)
+                        + self.salary_normalizer.base_range(parsed)))
+
+    def expire_jobs(self, platform: str, urls: List[str]) -> int:
+        """Mark jobs that disappeared from a fully crawled board as expired
+
+        Only call this with URLs known to be gone, e.g. from a complete
+        company board; a partial crawl proves nothing. Returns the number
+        of jobs expired.
+        """
+        expired = 0
+        try:
+            for url in urls:
+                job_ids = [row[0] for row in self.conn.execute(
+                    "SELECT id FROM jobs WHERE url = ? AND platform = ? AND expired_at IS NULL",
+                    (url, platform)
+                )]
+                for job_id in job_ids:
+                    self.cursor.execute(
+                        "UPDATE jobs SET expired_at = CURRENT_TIMESTAMP WHERE id = ?", (job_id,)
+                    )
+                    self.record_event(job_id, 'expired')
+                    expired += 1
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            self.conn.rollback()
+            return 0
+
+        return expired
+
+    def get_job_sections(self, job_id: int, section: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the ordered description sections of a job"""
+        sql = "SELECT section, type, position, content FROM job_sections WHERE job_id = ?"
+        params = [job_id]
+        if section:
+            sql += " AND section = ?"
+            params.append(section)
+        sql += " ORDER BY section, position"
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return [
+            {'section': row[0], 'type': row[1], 'position': row[2], 'content': row[3]}
+            for row in rows
+        ]
+
+    def find_jobs_by_section(self, section: str, term: str,
+                             platform: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Find jobs whose given section mentions a term
+
+        e.g. find_jobs_by_section('requirements', 'kubernetes')
+        """
+        if self.fts_enabled:
+            # Quote the term so FTS5 treats it as a phrase, not query syntax
+            match = '"' + term.replace('"', '""') + '"'
+            sql = '''
+                SELECT DISTINCT j.id, j.platform, j.job_title, j.company, j.url
+                FROM job_sections_fts f
+                JOIN job_sections s ON s.id = f.rowid
+                JOIN jobs j ON j.id = s.job_id
+                WHERE job_sections_fts MATCH ? AND s.section = ?
+            '''
+            params = [match, section]
+        else:
+            sql = '''
+                SELECT DISTINCT j.id, j.platform, j.job_title, j.company, j.url
+                FROM job_sections s
+                JOIN jobs j ON j.id = s.job_id
+                WHERE s.section = ? AND s.content LIKE ?
+            '''
+            params = [section, f'%{term}%']
+
+        if platform:
+            sql += " AND j.platform = ?"
+            params.append(platform)
+        sql += " ORDER BY j.id DESC LIMIT ?"
+        params.append(limit)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return [
+            {'id': row[0], 'platform': row[1], 'title': row[2], 'company': row[3], 'url': row[4]}
+            for row in rows
+        ]
+
+    def upsert_company(self, platform: str, name: str, url: Optional[str] = None,
+                       logo_url: Optional[str] = None, logo_hash: Optional[str] = None,
+                       logo_path: Optional[str] = None) -> int:
+        """Insert or refresh a company record and return its id
+
+        Fields passed as None keep their stored value.
+        """
+        self.cursor.execute('''
+            INSERT INTO companies (platform, name, url, logo_url, logo_hash, logo_path)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (platform, name) DO UPDATE SET
+                url = COALESCE(excluded.url, url),
+                logo_url = COALESCE(excluded.logo_url, logo_url),
+                logo_hash = COALESCE(excluded.logo_hash, logo_hash),
+                logo_path = COALESCE(excluded.logo_path, logo_path),
+                fetched_at = CURRENT_TIMESTAMP
+        ''', (platform, name, url, logo_url, logo_hash, logo_path))
+        company_id = self.conn.execute(
+            "SELECT id FROM companies WHERE platform = ? AND name = ?", (platform, name)
+        ).fetchone()[0]
+        self.conn.commit()
+        return company_id
+
+    def get_company(self, platform: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return a company record, with fetched_at as a unix timestamp"""
+        cur = self.conn.execute('''
+            SELECT id, platform, name, url, logo_url, logo_hash, logo_path,
+                   CAST(strftime('%s', fetched_at) AS REAL) AS fetched_at
+            FROM companies WHERE platform = ? AND name = ?
+        ''', (platform, name))
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return dict(zip([col[0] for col in cur.description], row))
+
+    def get_board_state(self, platform: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the crawl state of a company board, with job_ids as a list"""
+        row = self.conn.execute('''
+            SELECT etag, last_modified, body_hash, job_ids, checked_at, changed_at
+            FROM company_boards WHERE platform = ? AND url = ?
+        ''', (platform, url)).fetchone()
+        if row is None:
+            return None
+        return {
+            'etag': row[0], 'last_modified': row[1], 'body_hash': row[2],
+            'job_ids': json.loads(row[3]) if row[3] else [],
+            'checked_at': row[4], 'changed_at': row[5]
+        }
+
+    def save_board_state(self, platform: str, url: str, etag: Optional[str] = None,
+                         last_modified: Optional[str] = None, body_hash: Optional[str] = None,
+                         job_ids: Optional[List[str]] = None):
+        """Record a board check; job_ids=None means the board was unchanged"""
+        if job_ids is None:
+            self.cursor.execute('''
+                INSERT INTO company_boards (platform, url, checked_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (platform, url) DO UPDATE SET checked_at = CURRENT_TIMESTAMP
+            ''', (platform, url))
+        else:
+            self.cursor.execute('''
+                INSERT INTO company_boards
+                    (platform, url, etag, last_modified, body_hash, job_ids, checked_at, changed_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ON CONFLICT (platform, url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    body_hash = excluded.body_hash,
+                    job_ids = excluded.job_ids,
+                    checked_at = CURRENT_TIMESTAMP,
+                    changed_at = CURRENT_TIMESTAMP
+            ''', (platform, url, etag, last_modified, body_hash, json.dumps(sorted(job_ids))))
+        self.conn.commit()
 
     def job_exists(self, url: str, platform: str) -> bool:
-        """Check if job already exist in database"""
+        """Check if job already exist in database, archived jobs included"""
         self.cursor.execute(
             "SELECT 1 FROM jobs WHERE url = ? AND platform = ?",
             (url, platform)
         )
+        if self.cursor.fetchone() is not None:
+            return True
+        self.cursor.execute(
+            "SELECT 1 FROM archived_jobs WHERE url = ? AND platform = ?",
+            (url, platform)
+        )
         return self.cursor.fetchone() is not None
 
+    def existing_urls(self, platform: str, urls: List[str]) -> Set[str]:
+        """The urls already stored for a platform, archived jobs included
+
+        One query per 500 urls instead of a job_exists call per job.
+        """
+        existing = set()
+        urls = list(dict.fromkeys(url for url in urls if url))
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            for table in ('jobs', 'archived_jobs'):
+                self.cursor.execute(
+                    f"SELECT url FROM {table} WHERE platform = ? AND url IN ({placeholders})",
+                    [platform] + chunk
+                )
+                existing.update(row[0] for row in self.cursor.fetchall())
+        return existing
+
     def close(self):
         """Close database connection"""
         if self.conn:
-            self.conn.close()
\ No newline at end of file
+            self.conn.close()
+
+
+def _stats_upsert(row: str, sign: int) -> str:
+    """Trigger statement adding a jobs row (new or old) to job_stats, or removing it"""
+    values = ',\n'.join(
+        f"('{dimension}', COALESCE({expression.format(row=row)}, ''), COALESCE({row}.platform, ''), "
+        f"{sign}, {sign} * ({row}.expired_at IS NULL))"
+        for dimension, expression in STATS_DIMENSIONS.items()
+    )
+    return f'''INSERT INTO job_stats (dimension, value, platform, jobs, active) VALUES
+                {values}
+                ON CONFLICT (dimension, value, platform) DO UPDATE
+                SET jobs = jobs + excluded.jobs, active = active + excluded.active;'''
+
+
+def _requirements_text(requirements: Any) -> Optional[str]:
+    """Requirements as stored in the jobs table, lists as JSON like Job.to_db_params"""
+    if isinstance(requirements, (list, dict)):
+        return json.dumps(requirements, ensure_ascii=False)
+    return requirements
+
+
+def _skill_text(*parts: Any) -> str:
+    """Join the job fields skills are extracted from"""
+    texts = []
+    for part in parts:
+        if isinstance(part, (list, tuple)):
+            texts.extend(str(item) for item in part)
+        elif part:
+            texts.append(str(part))
+    return '\n'.join(texts)
@@ -0,0 +1,63 @@
+import json
+from typing import Dict, Any, List, Tuple, Optional
+
+
+# Sections produced by the platform description extractors
+SECTIONS = ('main_description', 'requirements', 'benefits')
+
+
+def load_description(description: Any) -> Optional[Dict[str, Any]]:
+    """Return the structured description dict, decoding legacy JSON blobs"""
+    if isinstance(description, dict):
+        return description
+
+    if isinstance(description, str) and description.startswith('{'):
+        try:
+            data = json.loads(description)
+        except ValueError:
+            return None
+        if isinstance(data, dict):
+            return data
+
+    return None
+
+
+def flatten_sections(description: Any) -> List[Tuple[str, str, int, str]]:
+    """Flatten a structured description into (section, type, position, content) rows
+
+    List entries are expanded into one row per item so every requirement or
+    benefit line can be matched on its own.
+    """
+    data = load_description(description)
+    if not data:
+        return []
+
+    rows = []
+    for section, entries in data.items():
+        position = 0
+        for entry in entries or []:
+            entry_type = entry.get('type', 'paragraph')
+            if 'items' in entry:
+                contents = entry['items']
+            else:
+                contents = [entry.get('content')]
+
+            for content in contents:
+                if not content:
+                    continue
+                rows.append((section, entry_type, position, content))
+                position += 1
+
+    return rows
+
+
+def description_text(description: Any) -> str:
+    """Plain text rendering of a description, structured or not"""
+    if description is None:
+        return ''
+
+    data = load_description(description)
+    if data is None:
+        return str(description)
+
+    return '\n'.join(row[3] for row in flatten_sections(data))
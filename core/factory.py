@@ -1,19 +1,22 @@
 import importlib
 import os
 from typing import Dict, Type
-from .base_scrapper import BasePlatformScrapper
+from .base_scraper import BasePlatformScraper
+
+# Directory holding platforms/ and the bundled <platform>_scraper.py modules
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 class ScrapperFactory:
     """Dynamic factory for creating platform-specific scrapers"""
-    _scrapers: Dict[str, Type[BasePlatformScrapper]] = {}
+    _scrapers: Dict[str, Type[BasePlatformScraper]] = {}
 
     @classmethod
-    def register_scraper(cls, platform_name: str, scraper_class: Type[BasePlatformScrapper]):
+    def register_scraper(cls, platform_name: str, scraper_class: Type[BasePlatformScraper]):
         """Resgister a new scraper class"""
         cls._scrapers[platform_name.lower()] = scraper_class
 
     @classmethod
-    def create_scraper(cls, platform: str) -> BasePlatformScrapper:
+    def create_scraper(cls, platform: str) -> BasePlatformScraper:
         """Create a platform-specific scrapers"""
 
         platform_lower = platform.lower()
@@ -22,28 +25,35 @@ class ScrapperFactory:
         if platform_lower in cls._scrapers:
             return cls._scrapers[platform_lower]()
         
-        # Try to dynamically import from platform directory
-        try:
-            module = importlib.import_module(f'platforms.{platform_lower}_scraper')
-            scraper_class = getattr(module, f'{platform.title()}Scraper')
-
-            # Register for future use
-            cls.register_scraper(platform_lower, scraper_class)
-            return scraper_class()
-        
-        except (ImportError, AttributeError) as e:
-            available_platforms = cls.get_available_platforms()
-            raise ValueError(f"Unsupported platform: {platform}. Available platforms: {available_platforms}")
-        
+        # Try to dynamically import from the platforms package, then from
+        # the project root where the bundled scrapers live
+        for module_name in (f'platforms.{platform_lower}_scraper', f'{platform_lower}_scraper'):
+            try:
+                module = importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                # A scraper whose own dependencies are missing should say so
+                if e.name not in (module_name, 'platforms'):
+                    raise
+                continue
+
+            scraper_class = getattr(module, f'{platform.title()}Scraper', None)
+            if scraper_class is not None:
+                # Register for future use
+                cls.register_scraper(platform_lower, scraper_class)
+                return scraper_class()
+
+        available_platforms = cls.get_available_platforms()
+        raise ValueError(f"Unsupported platform: {platform}. Available platforms: {available_platforms}")
 
     @classmethod
     def get_available_platforms(cls) -> list:
         """Get list of available platforms"""
         platforms = list(cls._scrapers.keys())
 
-        # Also check platforms directory
-        platforms_dir = 'platforms'
-        if os.path.exists(platforms_dir):
+        # Also check the platforms directory and the project root
+        for platforms_dir in (os.path.join(PROJECT_ROOT, 'platforms'), PROJECT_ROOT):
+            if not os.path.isdir(platforms_dir):
+                continue
             for file in os.listdir(platforms_dir):
                 if file.endswith('_scraper.py') and file != '__init__.py':
                     platform = file.replace('_scraper.py', '')
@@ -1,43 +1,57 @@
-from typing import Dict, Any, List
+from .descriptions import description_text
+from .models import Job
+from .salary import SalaryNormalizer
 
 
 class JobFilter:
     """Job filtering logic"""
 
     def __init__(self, keywords=None, locations=None, job_types=None,
-                 salary_min=None, companies=None):
+                 salary_min=None, companies=None, salary_normalizer=None):
         self.keywords = [k.lower() for k in (keywords or [])]
         self.locations = [l.lower() for l in (locations or [])]
         self.job_types = [jt.lower() for jt in (job_types or [])]
+        # Annual amount in the normalizer's base currency
         self.salary_min = salary_min
+        self.salary_normalizer = salary_normalizer or SalaryNormalizer()
         self.companies = [c.lower() for c in (companies or [])]
 
-    def filter_job(self, job_info: Dict[str, Any]) -> bool:
+    def filter_job(self, job: Job) -> bool:
         """Filter job based on criteria"""
 
         # Keyword filtering
         if self.keywords:
-            title = job_info.get('title', '').lower()
-            description = job_info.get('description', '').lower()
+            title = (job.title or '').lower()
+            description = description_text(job.description).lower()
             if not any(keyword in title or keyword in description for keyword in self.keywords):
                 return False
             
         # Location Filter
         if self.locations:
-            job_location = job_info.get('location', '').lower()
+            job_location = (job.location or '').lower()
             if not any(location in job_location for location in self.locations):
                 return False
         
         # Job type filter
         if self.job_types:
-            job_type = job_info.get('job_type', '').lower()
+            job_type = (job.job_type or '').lower()
             if not any(jtype in job_type for jtype in self.job_types):
                 return False
             
         # Company filtering
         if self.companies:
-            company_name = job_info.get('company', '').lower()
+            company_name = (job.company or '').lower()
             if not any(company in company_name for company in self.companies):
                 return False
         
+        # Salary filter; jobs with an unknown or unconvertible salary pass,
+        # and so do jobs without a period since it cannot be annualized safely
+        if self.salary_min is not None:
+            self.salary_normalizer.apply(job)
+            if job.salary_period is not None:
+                low, high = self.salary_normalizer.base_range(job)
+                best = high if high is not None else low
+                if best is not None and best < self.salary_min:
+                    return False
+
         return True
\ No newline at end of file
@@ -0,0 +1,91 @@
+import json
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, Tuple
+
+from .descriptions import description_text
+
+
+# Placeholder older scrapers use for fields they could not extract
+NOT_FOUND = 'Not found'
+
+
+@dataclass(slots=True)
+class Job:
+    """A job record shared by scrapers, filters and the database
+
+    Missing values are None rather than placeholder strings. description
+    may hold the structured sections dict produced by the platform
+    extractors or plain text.
+    """
+    platform: str
+    url: Optional[str] = None
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    salary: Optional[str] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_currency: Optional[str] = None
+    salary_period: Optional[str] = None
+    description: Any = None
+    requirements: Any = None
+    post_date: Optional[str] = None
+    company_logo: Optional[str] = None
+    company_url: Optional[str] = None
+    company_id: Optional[int] = None
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+
+    # Column order of the jobs table insert, see DatabaseManager.insert_job
+    DB_COLUMNS = ('platform', 'job_title', 'company', 'location', 'job_type', 'salary',
+                  'description', 'requirements', 'post_date', 'url', 'company_logo', 'raw_data',
+                  'company_id', 'salary_min', 'salary_max', 'salary_currency', 'salary_period')
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        """Build a Job from a legacy job_info dict"""
+        job = cls(platform=data.get('platform'))
+        job.update(data)
+        return job
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """Merge extracted fields into the record
+
+        Unknown keys are kept in raw_data so nothing a scraper extracts is lost.
+        """
+        for key, value in data.items():
+            if value == NOT_FOUND:
+                value = None
+            if key in _FIELD_NAMES:
+                setattr(self, key, value)
+            else:
+                self.raw_data[key] = value
+
+    def to_db_params(self) -> Tuple[Any, ...]:
+        """Parameters for the jobs table insert, in DB_COLUMNS order"""
+        requirements = self.requirements
+        if isinstance(requirements, (list, dict)):
+            requirements = json.dumps(requirements, ensure_ascii=False)
+
+        return (
+            self.platform,
+            self.title,
+            self.company,
+            self.location,
+            self.job_type,
+            self.salary,
+            description_text(self.description) if self.description is not None else None,
+            requirements,
+            self.post_date,
+            self.url,
+            self.company_logo,
+            json.dumps(self.raw_data, ensure_ascii=False),
+            self.company_id,
+            self.salary_min,
+            self.salary_max,
+            self.salary_currency,
+            self.salary_period
+        )
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Job))
@@ -1,18 +1,36 @@
 import time
 import random
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .database import DatabaseManager
+from .store import JobStore
+from .companies import CompanyCache
 from .filters import JobFilter
 from .base_scraper import BasePlatformScraper
+from .models import Job
 
 
 class JobScrapperOrchestrator:
     """Main orchestrator that works with any platform scrapper"""
 
-    def __init__(self, platform_scrapper: BasePlatformScrapper, db_name='job_scrapper.db'):
+    def __init__(self, platform_scrapper: BasePlatformScraper, db_name='job_scrapper.db',
+                 keep_alive: bool = False, store: Optional[JobStore] = None,
+                 company_cache: Optional[CompanyCache] = None, delay: Tuple[float, float] = (1, 3)):
         self.platform_scrapper = platform_scrapper
-        self.db_manager = DatabaseManager(db_name)
+        # A shared store is owned by the caller and left open on cleanup
+        self.owns_db = store is None
+        self.db_manager = store if store is not None else DatabaseManager(db_name)
         self.job_filter = JobFilter()
+        self.company_cache = company_cache or CompanyCache(self.db_manager)
+        self.platform_scrapper.company_cache = self.company_cache
+        # keep_alive leaves the driver and database open between runs
+        self.keep_alive = keep_alive
+        # Seconds to wait between jobs, drawn uniformly from this range
+        self.delay = delay
+        self.healthy = True
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start a fresh set of run statistics"""
         self.stats = {
             'total_found': 0,
             'filtered_out': 0,
@@ -20,13 +38,9 @@ class JobScrapperOrchestrator:
             'scraped': 0,
             'errors': 0
         }
-
+        # Known jobs seen on the current page, refreshed once per page
+        self._seen_jobs = []
 
-    def set_filter_criteria(self, **filter_params):
-        """set filtering criteria"""
-        self.job_filter = JobFilter(**filter_params)
-
-    
     def set_filter_criteria(self, **filter_params):
         """set filtering criteria"""
         self.job_filter = JobFilter(**filter_params)
@@ -34,7 +48,8 @@ class JobScrapperOrchestrator:
     def scrape_jobs(self, search_params: Dict[str, Any], max_pages: int = 5):
         """main scrapping orchestration method"""
         try:
-            self.platform_scrapper.setup_driver()
+            if self.platform_scrapper.driver is None:
+                self.platform_scrapper.setup_driver()
             self.platform_scrapper.get_job_listings_page(search_params)
 
             pages_scraped = 0
@@ -42,69 +57,110 @@ class JobScrapperOrchestrator:
             while pages_scraped < max_pages:
                 print(f"Scrapping page {pages_scraped + 1} from {self.platform_scrapper.platform_name}")
 
-                job_elements = self.platform_scrapper.get_job_elements()
-                self.stats['total_found'] += len(job_elements)
+                jobs = self.platform_scrapper.extract_listing_page()
+                self.stats['total_found'] += len(jobs)
 
-                for job_element in job_elements:
+                for job in self.select_new_jobs(jobs):
                     try:
-                        self.process_job_element(job_element)
+                        self.process_job(job)
                     except Exception as e:
                         print(f"Error processing job: {e}")
                         self.stats['errors'] += 1
 
                     # Respectful delay
-                    time.sleep(random.uniform(1, 3))
+                    time.sleep(random.uniform(*self.delay))
+
+                self._flush_seen()
                 
                 # Try to go to the next page
                 if not self.platform_scrapper.has_next_page():
                     print("No more pages available")
                     break
 
-                if not self.platform_scrapper.has_next_page():
+                if not self.platform_scrapper.go_to_next_page():
                     print("Failed to navigate to next page")
                     break
 
                 pages_scraped += 1
             
-            self.print_stats()
+            self._print_stats()
             return self.stats['scraped']
         
         except Exception as e:
             print(f"Error during scraping: {e}")
+            self.healthy = False
             return 0
         
         finally:
-            self.cleanup()
+            if not self.keep_alive:
+                self.cleanup()
 
     
+    def select_new_jobs(self, jobs: List[Job]) -> List[Job]:
+        """Drop the known and filtered out jobs of a listing page
+
+        Duplicates are looked up with one query for the whole page, before
+        any detail page is fetched.
+        """
+        existing = self.db_manager.existing_urls(self.platform_scrapper.platform_name,
+                                                 [job.url for job in jobs])
+        listed = set()
+        new_jobs = []
+
+        for job in jobs:
+            # check for duplicates
+            if job.url in existing:
+                self.stats['duplicates'] += 1
+                self._seen_jobs.append(job)
+                continue
+            if job.url in listed:
+                self.stats['duplicates'] += 1
+                continue
+            if job.url:
+                listed.add(job.url)
+
+            # Apply filters
+            if not self.job_filter.filter_job(job):
+                self.stats['filtered_out'] += 1
+                continue
+            new_jobs.append(job)
+
+        return new_jobs
+
     def process_job_element(self, job_element):
         """Process a single job element"""
+        job = self.platform_scrapper.extract_basic_job_info(job_element)
+        for job in self.select_new_jobs([job]):
+            self.process_job(job)
 
-        # Extract basic info
-        job_info = self.platform_scrapper.extract_basic_job_info(job_element)
+    def process_job(self, job: Job):
+        """Fetch the details of a new job and save it"""
+        detailed_info = self.platform_scrapper.extract_detailed_job_info(job.url)
+        job.update(detailed_info)
 
-        # check for duplicates
-        if self.db_manager.job_exists(job_info.get('url', ''),
-                                      self.platform_scrapper.platform_name):
-            self.stats['duplicates'] += 1
-            return
-        
-        # Apply filters
-        if not self.job_filter.filter_job(job_info):
+        # Check again with the detail fields, e.g. a salary only shown on the job page
+        if not self.job_filter.filter_job(job):
             self.stats['filtered_out'] += 1
             return
-        
-        # Get detailed info of job
-        detailed_info = self.platform_scrapper.extract_detailed_job_info(job_info.get('url', ''))
-        job_info.update(detailed_info)
+        self.company_cache.resolve(job)
 
         # Save to database
-        if self.db_manager.insert_job(job_info):
+        if self.db_manager.insert_job(job):
             self.stats['scraped'] += 1
 
-            print(f"✓ Scraped: {job_info.get('title', 'Unknown')} at {job_info.get('company', 'Unknown')}")
+            print(f"✓ Scraped: {job.title or 'Unknown'} at {job.company or 'Unknown'}")
 
     
+    def _flush_seen(self):
+        """Refresh the known jobs seen since the last flush
+
+        Sets last_seen and stores listing fields that changed, which
+        records an 'updated' event in the outbox.
+        """
+        if self._seen_jobs:
+            self.db_manager.refresh_jobs(self._seen_jobs)
+            self._seen_jobs = []
+
     def _print_stats(self):
         """print scraping statistics"""
         print("\n" + "="*50)
@@ -118,5 +174,6 @@ class JobScrapperOrchestrator:
     def cleanup(self):
         """Clean up resources"""
         self.platform_scrapper.cleanup()
-        self.db_manager.close()
+        if self.owns_db:
+            self.db_manager.close()
         
\ No newline at end of file
@@ -0,0 +1,225 @@
+import os
+import re
+import time
+import zlib
+import hashlib
+import sqlite3
+import threading
+import urllib.request
+import urllib.error
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Dict, Any, Optional
+
+
+# Query parameters that never change the page content
+IGNORED_QUERY_PARAMS = ('utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
+                        'utm_content', 'ref', 'source')
+
+SCRIPT_RE = re.compile(r'<script\b.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+
+class CacheMissError(Exception):
+    """Raised in cache-only mode when a page is not cached"""
+
+
+class PageCache:
+    """On-disk cache of rendered pages keyed by normalized URL
+
+    Bodies are zlib compressed files under cache_dir, indexed by a small
+    SQLite database holding fetch time, validators and last access time.
+    Entries expire after the TTL of their platform and the least recently
+    used ones are evicted once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = 'page_cache', max_bytes: int = 512 * 1024 * 1024,
+                 default_ttl: int = 6 * 3600, ttls: Optional[Dict[str, int]] = None,
+                 cache_only: bool = False, collect_validators: bool = False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.cache_only = cache_only
+        self.collect_validators = collect_validators
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'evicted': 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # Shared by scraper threads; every index access holds self._lock
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'), timeout=30,
+                                    check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_access ON pages (last_access)")
+        self.conn.commit()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Canonical form of a URL: lowercase host, no fragment, sorted query"""
+        parts = urlsplit(url.strip())
+        query = sorted(
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in IGNORED_QUERY_PARAMS
+        )
+        path = parts.path.rstrip('/') or '/'
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(self.normalize_url(url).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + '.z')
+
+    def ttl_for(self, platform: str) -> int:
+        return self.ttls.get(platform, self.default_ttl)
+
+    def get(self, url: str, platform: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the cached page for url, or None if missing or expired"""
+        key = self._key(url)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, fetched_at, etag, last_modified FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+
+        now = time.time()
+        if row is None or (not allow_stale and now - row[1] > self.ttl_for(platform)):
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            with open(self._path(key), 'rb') as f:
+                body = zlib.decompress(f.read()).decode('utf-8')
+        except (OSError, zlib.error):
+            self._delete(key)
+            self.stats['misses'] += 1
+            return None
+
+        with self._lock:
+            self.conn.execute("UPDATE pages SET last_access = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.stats['hits'] += 1
+        return {
+            'url': row[0],
+            'body': body,
+            'fetched_at': row[1],
+            'etag': row[2],
+            'last_modified': row[3]
+        }
+
+    def put(self, url: str, platform: str, body: str,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a page body, replacing any previous entry for the same URL"""
+        if etag is None and last_modified is None and self.collect_validators:
+            etag, last_modified = self.fetch_validators(url)
+
+        # Scripts would re-render the page when it is loaded from disk
+        data = zlib.compress(SCRIPT_RE.sub('', body).encode('utf-8'), 6)
+        key = self._key(url)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO pages (key, url, platform, size, fetched_at, last_access, etag, last_modified)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (key, url, platform, len(data), now, now, etag, last_modified))
+            self.conn.commit()
+            self.evict()
+
+    def revalidate(self, url: str, platform: str) -> bool:
+        """Refresh a stale entry with a conditional request
+
+        Returns True if the server answered 304 Not Modified and the cached
+        body is fresh again.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified FROM pages WHERE key = ?", (self._key(url),)
+            ).fetchone()
+        if row is None or (row[0] is None and row[1] is None):
+            return False
+
+        request = urllib.request.Request(url, method='HEAD')
+        if row[0]:
+            request.add_header('If-None-Match', row[0])
+        if row[1]:
+            request.add_header('If-Modified-Since', row[1])
+
+        try:
+            urllib.request.urlopen(request, timeout=10)
+            return False
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                return False
+        except (urllib.error.URLError, OSError):
+            return False
+
+        with self._lock:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE key = ?", (time.time(), self._key(url))
+            )
+            self.conn.commit()
+            self.stats['revalidated'] += 1
+        return True
+
+    @staticmethod
+    def fetch_validators(url: str):
+        """Return the (ETag, Last-Modified) headers of url, if the server sends them"""
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method='HEAD'), timeout=10) as response:
+                return response.headers.get('ETag'), response.headers.get('Last-Modified')
+        except (urllib.error.URLError, OSError):
+            return None, None
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits max_bytes"""
+        with self._lock:
+            excess = self.total_size() - self.max_bytes
+            evicted = 0
+            if excess <= 0:
+                return evicted
+
+            rows = self.conn.execute("SELECT key, size FROM pages ORDER BY last_access").fetchall()
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                self._delete(key, commit=False)
+                excess -= size
+                evicted += 1
+
+            self.conn.commit()
+            self.stats['evicted'] += evicted
+            return evicted
+
+    def _delete(self, key: str, commit: bool = True) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            if commit:
+                self.conn.commit()
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def close(self):
+        """Close the cache index"""
+        self.conn.close()
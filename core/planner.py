@@ -0,0 +1,189 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Type
+
+from .base_scraper import BasePlatformScraper
+from .orchestrator import JobScrapperOrchestrator
+from .store import JobStore
+
+
+class SearchShard:
+    """One narrowed search and its result count"""
+
+    def __init__(self, search_params: Dict[str, Any], count: Optional[int] = None):
+        self.search_params = search_params
+        self.count = count
+        # Still at the cap with nothing left to split on
+        self.truncated = False
+
+    def __repr__(self):
+        return f"SearchShard({self.search_params}, count={self.count})"
+
+
+class SearchPlanner:
+    """Covers a broad search with shards small enough to page through completely
+
+    Boards only page through result_cap results of a search. A search at
+    the cap is split into one shard per value of the next dimension:
+    locations, then the platform's exhaustive shard_dimensions (employment
+    type, workplace), then keywords. Keywords come last because a job
+    matching none of them is missed, so they are only used once the
+    exhaustive dimensions are used up. Counting and scraping run on
+    `workers` threads, each with its own browser; results are merged and
+    deduplicated by the shared JobStore. scraper_class is instantiated once
+    per worker, like the backfill workers.
+    """
+
+    def __init__(self, scraper_class: Type[BasePlatformScraper], store: JobStore, workers: int = 4,
+                 locations: Optional[List[str]] = None, keywords: Optional[List[str]] = None,
+                 result_cap: Optional[int] = None, filter_params: Optional[Dict[str, Any]] = None):
+        self.scraper_class = scraper_class
+        self.store = store
+        self.workers = workers
+        self.locations = locations or []
+        self.keywords = keywords or []
+        self.filter_params = filter_params or {}
+        # Driverless instance for the platform's cap and dimensions
+        self.scraper = scraper_class()
+        self.result_cap = result_cap if result_cap is not None else self.scraper.result_cap
+        self._local = threading.local()
+        self._orchestrators: List[JobScrapperOrchestrator] = []
+        self._lock = threading.Lock()
+
+    def run(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Plan the shards of a search and scrape them all"""
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                shards, gaps = self.plan(search_params, executor)
+                results = list(executor.map(self._scrape_shard, shards))
+        finally:
+            self.cleanup()
+
+        stats = {'shards': len(shards), 'truncated_shards': sum(shard.truncated for shard in shards),
+                 'uncovered': gaps}
+        for shard_stats in results:
+            for key, value in shard_stats.items():
+                stats[key] = stats.get(key, 0) + value
+
+        self._print_stats(stats)
+        return stats
+
+    def plan(self, search_params: Dict[str, Any],
+             executor: ThreadPoolExecutor) -> Tuple[List[SearchShard], int]:
+        """Split a search until every shard is under the result cap
+
+        Splitting starts from the search the platform would really run,
+        e.g. with its default location, or from one shard per location.
+        Each level of the split is counted concurrently. Returns the leaf
+        shards and the number of results the splits could not account for,
+        e.g. jobs without an employment type or matching no keyword.
+        """
+        if self.locations and not search_params.get('location'):
+            # The planner's locations replace the platform's default location
+            pending = [SearchShard({**search_params, 'location': location}) for location in self.locations]
+        else:
+            pending = [SearchShard(self.scraper.effective_search_params(search_params))]
+        leaves = []
+        splits: List[Tuple[SearchShard, List[SearchShard]]] = []
+
+        while pending:
+            counts = list(executor.map(self._count, [shard.search_params for shard in pending]))
+            cap = self.result_cap
+            children = []
+            for shard, count in zip(pending, counts):
+                shard.count = count
+                if cap is None or count is None or count < cap:
+                    leaves.append(shard)
+                    continue
+
+                split = self._split(shard)
+                if not split:
+                    shard.truncated = True
+                    leaves.append(shard)
+                    print(f"Shard still at the result cap, results may be missed: {shard.search_params}")
+                    continue
+                splits.append((shard, split))
+                children.extend(split)
+            pending = children
+
+        # Only meaningful where the board reports totals past the cap
+        uncovered = 0
+        for parent, split in splits:
+            covered = sum(child.count or 0 for child in split)
+            if covered > parent.count:
+                print(f"Shards of {parent.search_params} count {covered} results, "
+                      f"more than the {parent.count} of the search itself")
+            uncovered += max(0, parent.count - covered)
+
+        # Empty shards have nothing to scrape
+        return [shard for shard in leaves if shard.count != 0], uncovered
+
+    def _split(self, shard: SearchShard) -> List[SearchShard]:
+        """Children of a shard along the first dimension it does not fix yet"""
+        for param, values in self._dimensions():
+            if not values or shard.search_params.get(param):
+                continue
+            return [SearchShard({**shard.search_params, param: value}) for value in values]
+        return []
+
+    def _dimensions(self) -> List[Tuple[str, List[str]]]:
+        return [('location', self.locations)] + list(self.scraper.shard_dimensions) + [('query', self.keywords)]
+
+    def _count(self, search_params: Dict[str, Any]) -> Optional[int]:
+        try:
+            scraper = self._orchestrator().platform_scrapper
+            if scraper.driver is None:
+                scraper.setup_driver()
+            return scraper.count_results(search_params)
+        except Exception as e:
+            print(f"Error counting results of {search_params}: {e}")
+            return None
+
+    def _scrape_shard(self, shard: SearchShard) -> Dict[str, int]:
+        orchestrator = self._orchestrator()
+        scraper = orchestrator.platform_scrapper
+        orchestrator.reset_stats()
+        orchestrator.set_filter_criteria(**self.filter_params)
+
+        # Page through everything the shard can show; unknown counts page until the end
+        results = shard.count if shard.count is not None else self.result_cap or 10 ** 6
+        max_pages = max(1, -(-results // scraper.results_per_page))
+        orchestrator.scrape_jobs(shard.search_params, max_pages)
+        stats = dict(orchestrator.stats)
+
+        if not orchestrator.healthy:
+            # Drop a broken browser session; the next shard starts a fresh one
+            orchestrator.cleanup()
+            self._local.orchestrator = None
+        return stats
+
+    def _orchestrator(self) -> JobScrapperOrchestrator:
+        """The calling worker thread's orchestrator, browser kept open between shards
+
+        The browser starts on first use: scrape_jobs starts it itself, counting
+        starts it in _count.
+        """
+        orchestrator = getattr(self._local, 'orchestrator', None)
+        if orchestrator is None:
+            scraper = self.scraper_class()
+            orchestrator = JobScrapperOrchestrator(scraper, keep_alive=True, store=self.store)
+            self._local.orchestrator = orchestrator
+            with self._lock:
+                self._orchestrators.append(orchestrator)
+        return orchestrator
+
+    def cleanup(self):
+        """Close every worker's browser"""
+        with self._lock:
+            for orchestrator in self._orchestrators:
+                orchestrator.cleanup()
+            self._orchestrators = []
+
+    def _print_stats(self, stats: Dict[str, Any]):
+        """print planner statistics"""
+        print("\n" + "="*50)
+        print(f"SHARDED SEARCH STATISTICS - {self.scraper.platform_name}")
+        print("="*50)
+        for key, value in stats.items():
+            print(f"{key.replace('_', ' ').title()}: {value}")
+        print("="*50)
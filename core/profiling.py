@@ -0,0 +1,193 @@
+import os
+import re
+import sys
+import time
+import pstats
+import cProfile
+import datetime
+import threading
+from collections import Counter, defaultdict
+from typing import Callable, Any, Dict, List, Tuple
+
+
+class StackSampler:
+    """Samples the Python stacks of all threads at a fixed interval
+
+    Collected stacks are written in the folded format understood by
+    flamegraph.pl and speedscope: "frame;frame;frame count" per line.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{_module_name(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def write_folded(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+_module_names: Dict[str, str] = {}
+
+# "<method 'execute' of 'sqlite3.Cursor' objects>", "<built-in method time.sleep>"
+BUILTIN_OWNER_RE = re.compile(r"of '([\w.]+?)\.\w+' objects|built-in method ([\w.]+)\.\w+")
+
+
+def _module_name(filename: str) -> str:
+    """Map a source file to its module name, e.g. core.orchestrator"""
+    if filename in _module_names:
+        return _module_names[filename]
+
+    path = os.path.abspath(filename)
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, '__file__', None)
+        if module_file and os.path.abspath(module_file) == path:
+            _module_names[filename] = name
+            return name
+
+    # Builtins and frozen modules, e.g. '~' or '<frozen importlib._bootstrap>'
+    _module_names[filename] = filename.strip('<>~') or 'builtins'
+    return _module_names[filename]
+
+
+def summarize_stats(stats: pstats.Stats, top_n: int = 25) -> Tuple[List[Tuple[str, float]], List[Tuple[str, int, float, float]]]:
+    """Return (time per module, top-N functions) from profiler stats
+
+    Module totals use internal time so nested calls are not counted twice.
+    Functions are ranked by internal time and reported as
+    (module:function, calls, internal time, cumulative time).
+    """
+    per_module = defaultdict(float)
+    functions = []
+
+    for (filename, lineno, funcname), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        module = _module_name(filename)
+        if filename == '~':
+            # C functions: charge them to their owning module (sqlite3, time, ...)
+            match = BUILTIN_OWNER_RE.search(funcname)
+            if match:
+                module = match.group(1) or match.group(2)
+        per_module[module] += tottime
+        functions.append((f"{module}:{funcname}", calls, tottime, cumtime))
+
+    modules = sorted(per_module.items(), key=lambda item: item[1], reverse=True)
+    functions.sort(key=lambda item: item[2], reverse=True)
+    return modules, functions[:top_n]
+
+
+def format_summary(modules: List[Tuple[str, float]], functions: List[Tuple[str, int, float, float]],
+                   wall_time: float, threads: int = 1) -> str:
+    lines = ["=" * 50, f"PROFILE SUMMARY - wall time {wall_time:.2f}s, {threads} thread(s)", "=" * 50,
+             "Time by module:"]
+    for module, seconds in modules[:15]:
+        lines.append(f"  {seconds:9.3f}s  {module}")
+
+    lines.append("Hot functions (internal time / cumulative / calls):")
+    for name, calls, tottime, cumtime in functions:
+        lines.append(f"  {tottime:9.3f}s  {cumtime:9.3f}s  {calls:8d}  {name}")
+    lines.append("=" * 50)
+    return '\n'.join(lines)
+
+
+class ThreadProfilers:
+    """cProfile for the calling thread and every thread started while active
+
+    cProfile.Profile only sees the thread that enabled it, so each new
+    thread enables its own profiler from a threading.setprofile hook. The
+    per-thread results are merged into one pstats.Stats.
+    """
+
+    def __init__(self):
+        self.profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        threading.setprofile(self._start_thread)
+        self._enable()
+
+    def stop(self) -> pstats.Stats:
+        threading.setprofile(None)
+        # The calling thread's profiler goes first: disabling the others from
+        # here also clears this thread's profile hook
+        main, *others = self.profilers
+        main.disable()
+        stats = pstats.Stats(main)
+        for profiler in others:
+            stats.add(profiler)
+        return stats
+
+    def _start_thread(self, frame, event, arg):
+        # Replaces this hook with the profiler for the rest of the thread
+        self._enable()
+
+    def _enable(self):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ profiles every thread from one profiler and
+            # refuses a second one
+            return
+        with self._lock:
+            self.profilers.append(profiler)
+
+
+def profile_run(func: Callable[..., Any], *args, output_dir: str = 'profiles',
+                top_n: int = 25, sample_interval: float = 0.005, **kwargs) -> Any:
+    """Run func under cProfile and the stack sampler and write the results
+
+    Every thread func starts is profiled too, and the summary totals
+    internal time over all threads, so it can exceed the wall time. Writes
+    <run>.prof (pstats / snakeviz), <run>.folded (flame graph input) and
+    <run>-summary.txt into output_dir, and prints the summary.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    run_name = os.path.join(output_dir, f"run-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}")
+
+    profilers = ThreadProfilers()
+    sampler = StackSampler(sample_interval)
+    started = time.perf_counter()
+
+    sampler.start()
+    profilers.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        stats = profilers.stop()
+        sampler.stop()
+        wall_time = time.perf_counter() - started
+
+        stats.dump_stats(f"{run_name}.prof")
+        sampler.write_folded(f"{run_name}.folded")
+
+        modules, functions = summarize_stats(stats, top_n)
+        summary = format_summary(modules, functions, wall_time, len(profilers.profilers))
+        with open(f"{run_name}-summary.txt", 'w', encoding='utf-8') as f:
+            f.write(summary + '\n')
+
+        print(summary)
+        print(f"Profile written to {run_name}.prof, {run_name}.folded")
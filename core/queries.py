@@ -0,0 +1,244 @@
+import json
+import sqlite3
+from typing import Dict, Any, List, Optional, Tuple
+
+from .database import DatabaseManager, STATS_DIMENSIONS, SALARY_BEST_BASE_SQL
+from .retention import COMPRESSED_COLUMNS, archive_paths, decompress
+
+
+# Columns returned by listing queries, all present in idx_jobs_platform_listing
+LISTING_COLUMNS = ('id', 'platform', 'job_title', 'company', 'location',
+                   'job_type', 'url', 'scrapped_at')
+
+
+class JobQuery:
+    """Read-side query layer over the jobs table
+
+    Listings use keyset pagination on (scrapped_at, id), newest first, so a
+    page costs the same no matter how deep into the result set it is.
+    With archive_dir set, listings and lookups can also read the monthly
+    archives written by RetentionManager.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, archive_dir: Optional[str] = None):
+        self.conn = db_manager.conn
+        self.db_name = db_manager.db_name
+        self.archive_dir = archive_dir
+        self._archive_conns: Dict[str, sqlite3.Connection] = {}
+
+    def list_jobs(self, platform: Optional[str] = None, company: Optional[str] = None,
+                  location: Optional[str] = None, job_type: Optional[str] = None,
+                  scraped_from: Optional[str] = None, scraped_to: Optional[str] = None,
+                  min_salary: Optional[float] = None, include_archives: bool = False,
+                  cursor: Optional[str] = None, limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return one page of jobs and the cursor for the next page
+
+        Filters match exactly so they can use the indexes. Dates are
+        'YYYY-MM-DD[ HH:MM:SS]' strings compared against scrapped_at, with
+        scraped_to exclusive. min_salary is an annual base-currency amount,
+        compared with the top of the salary range (or its minimum when
+        open-ended), and skips jobs without a converted salary.
+        include_archives merges in the archive months the filters can match.
+        The returned cursor is None on the last page.
+        """
+        conditions = []
+        params = []
+
+        for column, value in (('platform', platform), ('company', company),
+                              ('location', location), ('job_type', job_type)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        if scraped_from is not None:
+            conditions.append("scrapped_at >= ?")
+            params.append(scraped_from)
+        if scraped_to is not None:
+            conditions.append("scrapped_at < ?")
+            params.append(scraped_to)
+
+        if min_salary is not None:
+            conditions.append(f"{SALARY_BEST_BASE_SQL} >= ?")
+            params.append(min_salary)
+
+        last_scraped = None
+        if cursor is not None:
+            last_scraped, last_id = self.decode_cursor(cursor)
+            conditions.append("(scrapped_at, id) < (?, ?)")
+            params.extend([last_scraped, last_id])
+
+        # The SQL text only depends on which filters are set, so sqlite3's
+        # statement cache hands back the already prepared statement.
+        sql = f"SELECT {', '.join(LISTING_COLUMNS)} FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY scrapped_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        if include_archives:
+            # Archives hold whole months of scrapped_at, so months outside the
+            # date range or past the cursor are skipped without opening them
+            for month, path in self._archives():
+                if ((scraped_from and month < scraped_from[:7]) or (scraped_to and month > scraped_to[:7])
+                        or (last_scraped and month > last_scraped[:7])):
+                    continue
+                rows += self._archive_conn(path).execute(sql, params).fetchall()
+            rows.sort(key=lambda row: (row[7], row[0]), reverse=True)
+            rows = rows[:limit + 1]
+
+        jobs = [dict(zip(LISTING_COLUMNS, row)) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = jobs[-1]
+            next_cursor = self.encode_cursor(last['scrapped_at'], last['id'])
+
+        return jobs, next_cursor
+
+    def jobs_with_skills(self, skills: List[str], platform: Optional[str] = None,
+                         cursor: Optional[int] = None, limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Return one page of jobs that need all of the given skills, newest first
+
+        Skills are canonical taxonomy names, e.g. ['python', 'aws']. The
+        cursor is the last job id of the previous page.
+        """
+        skills = sorted({skill.lower() for skill in skills})
+        if not skills:
+            return [], None
+
+        sql = f"""
+            SELECT job_id FROM job_skills
+            WHERE skill IN ({', '.join('?' * len(skills))})
+        """
+        params: List[Any] = list(skills)
+        if cursor is not None:
+            sql += " AND job_id < ?"
+            params.append(cursor)
+        sql += " GROUP BY job_id HAVING COUNT(*) = ?"
+        params.append(len(skills))
+
+        listing = f"SELECT {', '.join('j.' + col for col in LISTING_COLUMNS)} FROM jobs j"
+        sql = f"{listing} WHERE j.id IN ({sql})"
+        if platform is not None:
+            sql += " AND j.platform = ?"
+            params.append(platform)
+        sql += " ORDER BY j.id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        jobs = [dict(zip(LISTING_COLUMNS, row)) for row in rows[:limit]]
+        next_cursor = jobs[-1]['id'] if len(rows) > limit else None
+        return jobs, next_cursor
+
+    def job_events(self, after_seq: int = 0, event: Optional[str] = None,
+                   limit: int = 1000) -> Tuple[List[Dict[str, Any]], int]:
+        """Return outbox events after a sequence number, oldest first
+
+        The second value is the cursor to resume from: the seq of the last
+        event returned, or after_seq if there was nothing new. Events are
+        only appended and writers are serialized, so a consumer that keeps
+        this cursor sees every event exactly once.
+        """
+        sql = "SELECT seq, job_id, event, payload, created_at FROM job_events WHERE seq > ?"
+        params = [after_seq]
+        if event is not None:
+            sql += " AND event = ?"
+            params.append(event)
+        sql += " ORDER BY seq LIMIT ?"
+        params.append(limit)
+
+        events = [
+            {'seq': row[0], 'job_id': row[1], 'event': row[2],
+             'job': json.loads(row[3]) if row[3] else None, 'created_at': row[4]}
+            for row in self.conn.execute(sql, params)
+        ]
+        return events, events[-1]['seq'] if events else after_seq
+
+    def job_stats(self, dimension: str, platform: Optional[str] = None,
+                  values: Optional[List[str]] = None, by_platform: bool = False,
+                  top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Job counts per company, location, job_type or day from the job_stats rollup
+
+        Reads the maintained counts instead of grouping the jobs table.
+        Each row has the value (None for jobs missing it), jobs and active
+        (not expired) counts, and its platform when by_platform is set.
+        Rows come largest first, or newest first for 'day'. Counts cover
+        the hot database; archived jobs are not included.
+        """
+        if dimension not in STATS_DIMENSIONS:
+            raise ValueError(f"Unknown dimension {dimension!r}, expected one of {sorted(STATS_DIMENSIONS)}")
+
+        group = 'value, platform' if by_platform else 'value'
+        sql = f"SELECT {group}, SUM(jobs), SUM(active) FROM job_stats WHERE dimension = ?"
+        params: List[Any] = [dimension]
+        if platform is not None:
+            sql += " AND platform = ?"
+            params.append(platform)
+        if values is not None:
+            sql += f" AND value IN ({', '.join('?' * len(values))})"
+            params.extend(value if value is not None else '' for value in values)
+        sql += f" GROUP BY {group} HAVING SUM(jobs) > 0"
+        sql += " ORDER BY value DESC" if dimension == 'day' else " ORDER BY SUM(jobs) DESC, value"
+        if top is not None:
+            sql += " LIMIT ?"
+            params.append(top)
+
+        stats = []
+        for row in self.conn.execute(sql, params):
+            entry = {'value': row[0] or None}
+            if by_platform:
+                entry['platform'] = row[1]
+            entry['jobs'], entry['active'] = row[-2], row[-1]
+            stats.append(entry)
+        return stats
+
+    def get_job(self, job_id: int, include_archives: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the full row of a single job"""
+        cur = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        row = cur.fetchone()
+        if row is not None:
+            return dict(zip([col[0] for col in cur.description], row))
+
+        if include_archives:
+            for _, path in self._archives():
+                cur = self._archive_conn(path).execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+                row = cur.fetchone()
+                if row is not None:
+                    job = dict(zip([col[0] for col in cur.description], row))
+                    for column in COMPRESSED_COLUMNS + ('sections',):
+                        job[column] = decompress(job[column])
+                    job['sections'] = json.loads(job['sections']) if job['sections'] else []
+                    return job
+        return None
+
+    def _archives(self) -> List[Tuple[str, str]]:
+        if not self.archive_dir:
+            return []
+        return archive_paths(self.db_name, self.archive_dir)
+
+    def _archive_conn(self, path: str) -> sqlite3.Connection:
+        """Read-only connection to an archive file, opened once"""
+        if path not in self._archive_conns:
+            self._archive_conns[path] = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        return self._archive_conns[path]
+
+    def close(self):
+        """Close the archive connections; the database connection belongs to the caller"""
+        for conn in self._archive_conns.values():
+            conn.close()
+        self._archive_conns = {}
+
+    @staticmethod
+    def encode_cursor(scrapped_at: str, job_id: int) -> str:
+        """Build an opaque page cursor from the last row of a page"""
+        return f"{scrapped_at}|{job_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[str, int]:
+        """Split a page cursor back into (scrapped_at, id)"""
+        try:
+            scrapped_at, job_id = cursor.rsplit('|', 1)
+            return scrapped_at, int(job_id)
+        except ValueError:
+            raise ValueError(f"Invalid page cursor: {cursor}")
@@ -0,0 +1,276 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from .database import DatabaseManager
+
+
+# Bulky text columns stored zlib compressed in the archives
+COMPRESSED_COLUMNS = ('description', 'requirements', 'raw_data')
+
+
+def archive_paths(db_name: str, archive_dir: str) -> List[Tuple[str, str]]:
+    """(month, path) of every archive file of a database, newest month first"""
+    prefix = os.path.splitext(os.path.basename(db_name))[0] + '-'
+    if not os.path.isdir(archive_dir):
+        return []
+
+    archives = []
+    for name in os.listdir(archive_dir):
+        month = name[len(prefix):-len('.db')]
+        if name.startswith(prefix) and name.endswith('.db') and len(month) == 7:
+            archives.append((month, os.path.join(archive_dir, name)))
+    return sorted(archives, reverse=True)
+
+
+def decompress(value: Optional[bytes]) -> Optional[str]:
+    """Inverse of the compression applied to archived text columns"""
+    return zlib.decompress(value).decode('utf-8') if value is not None else None
+
+
+class RetentionManager:
+    """Keeps the hot jobs table small by moving old jobs to monthly archives
+
+    A job is archived once it has not been seen for horizon_days (expired
+    jobs count from their expiry). Archived jobs go to one SQLite file per
+    month of scrapped_at under archive_dir, with their description,
+    requirements, raw data and sections zlib compressed. Their URLs stay in
+    the hot archived_jobs table so dedupe still recognizes them.
+
+    Every run also releases free pages with incremental vacuum, refreshes
+    the query planner statistics with ANALYZE and truncates the WAL.
+    """
+
+    def __init__(self, db_name: str, archive_dir: str = 'job_archive', horizon_days: float = 90,
+                 batch_size: int = 1000, interval: float = 24 * 3600,
+                 vacuum_pages: Optional[int] = None):
+        self.db_name = db_name
+        self.archive_dir = archive_dir
+        self.horizon_days = horizon_days
+        self.batch_size = batch_size
+        self.interval = interval
+        # Pages released per run; None releases every free page
+        self.vacuum_pages = vacuum_pages
+        self.state_file = os.path.join(
+            archive_dir, os.path.splitext(os.path.basename(db_name))[0] + '-retention.json'
+        )
+        self._stop = threading.Event()
+        self._thread = None
+
+        os.makedirs(archive_dir, exist_ok=True)
+
+    def run(self, convert: bool = False) -> Dict[str, Any]:
+        """Archive old jobs, then vacuum and analyze the hot database
+
+        convert switches a database created without incremental vacuum over
+        to it; that takes a full VACUUM, so it is opt-in.
+        """
+        db_manager = DatabaseManager(self.db_name)
+        try:
+            if convert:
+                self.enable_incremental_vacuum(db_manager)
+            stats = {'archived': self.archive_old_jobs(db_manager)}
+            stats.update(self.maintain(db_manager))
+        finally:
+            db_manager.close()
+
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({'last_run': time.time(), 'stats': stats}, f)
+        return stats
+
+    def run_if_due(self) -> Optional[Dict[str, Any]]:
+        """Run if the last run finished more than interval seconds ago"""
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                last_run = json.load(f)['last_run']
+        except (OSError, ValueError, KeyError):
+            last_run = 0
+        if time.time() - last_run < self.interval:
+            return None
+        return self.run()
+
+    def start(self):
+        """Run on schedule from a background thread"""
+        self._thread = threading.Thread(target=self._run_forever, name='retention', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run_forever(self):
+        while True:
+            try:
+                stats = self.run_if_due()
+                if stats:
+                    print(f"Retention on {self.db_name}: {stats}")
+            except sqlite3.Error as e:
+                print(f"Retention error on {self.db_name}: {e}")
+            if self._stop.wait(min(self.interval, 3600)):
+                break
+
+    def archive_old_jobs(self, db_manager: DatabaseManager) -> int:
+        """Move jobs past the horizon into their monthly archives"""
+        cutoff = (datetime.datetime.now(datetime.timezone.utc)
+                  - datetime.timedelta(days=self.horizon_days)).strftime('%Y-%m-%d %H:%M:%S')
+        archived = 0
+        last_id = 0
+
+        while True:
+            rows = db_manager.conn.execute('''
+                SELECT id, substr(scrapped_at, 1, 7) FROM jobs
+                WHERE id > ? AND COALESCE(expired_at, last_seen, scrapped_at) < ?
+                ORDER BY id LIMIT ?
+            ''', (last_id, cutoff, self.batch_size)).fetchall()
+            if not rows:
+                break
+
+            months: Dict[str, List[int]] = {}
+            for job_id, month in rows:
+                months.setdefault(month, []).append(job_id)
+            for month, job_ids in months.items():
+                archived += self._archive_batch(db_manager, month, job_ids)
+            last_id = rows[-1][0]
+
+        return archived
+
+    def _archive_batch(self, db_manager: DatabaseManager, month: str, job_ids: List[int]) -> int:
+        """Copy jobs to their archive, then remove them from the hot database
+
+        The archive is committed first and written with INSERT OR REPLACE,
+        so a crash in between only leaves a copy that the next run replaces.
+        """
+        conn = db_manager.conn
+        placeholders = ', '.join('?' * len(job_ids))
+        cur = conn.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders})", job_ids)
+        columns = [col[0] for col in cur.description]
+        jobs = cur.fetchall()
+
+        sections: Dict[int, List[List[Any]]] = {}
+        for job_id, section, entry_type, position, content in conn.execute(f'''
+            SELECT job_id, section, type, position, content FROM job_sections
+            WHERE job_id IN ({placeholders}) ORDER BY job_id, section, position
+        ''', job_ids):
+            sections.setdefault(job_id, []).append([section, entry_type, position, content])
+        skills: Dict[int, List[str]] = {}
+        for skill, job_id in conn.execute(
+            f"SELECT skill, job_id FROM job_skills WHERE job_id IN ({placeholders})", job_ids
+        ):
+            skills.setdefault(job_id, []).append(skill)
+
+        compressed = {columns.index(column) for column in COMPRESSED_COLUMNS}
+        rows = []
+        for job in jobs:
+            values = [_compress(value) if i in compressed else value for i, value in enumerate(job)]
+            job_id = job[0]
+            values.append(_compress(json.dumps(sections[job_id])) if job_id in sections else None)
+            values.append(','.join(sorted(skills.get(job_id, []))) or None)
+            rows.append(values)
+
+        archive_path = self._archive_path(month)
+        archive = self._open_archive(archive_path, db_manager)
+        try:
+            archive_columns = columns + ['sections', 'skills']
+            archive.executemany(f'''
+                INSERT OR REPLACE INTO jobs ({', '.join(archive_columns)})
+                VALUES ({', '.join('?' * len(archive_columns))})
+            ''', rows)
+            archive.commit()
+        finally:
+            archive.close()
+
+        url_index, platform_index = columns.index('url'), columns.index('platform')
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO archived_jobs (url, platform, archive) VALUES (?, ?, ?)",
+                [(job[url_index], job[platform_index], os.path.basename(archive_path))
+                 for job in jobs if job[url_index]]
+            )
+            # Sections and skills go with the job through ON DELETE CASCADE
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(job[0],) for job in jobs])
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+        return len(jobs)
+
+    def _archive_path(self, month: str) -> str:
+        prefix = os.path.splitext(os.path.basename(self.db_name))[0]
+        return os.path.join(self.archive_dir, f"{prefix}-{month}.db")
+
+    def _open_archive(self, path: str, db_manager: DatabaseManager) -> sqlite3.Connection:
+        """Open an archive file, creating or extending its table to match the hot schema"""
+        hot_columns = [(row[1], row[2]) for row in db_manager.conn.execute("PRAGMA table_info(jobs)")]
+        archive = sqlite3.connect(path, timeout=db_manager.timeout)
+
+        definitions = []
+        for name, column_type in hot_columns:
+            if name == 'id':
+                definitions.append('id INTEGER PRIMARY KEY')
+            else:
+                definitions.append(f"{name} {'BLOB' if name in COMPRESSED_COLUMNS else column_type}")
+        definitions += ['sections BLOB', 'skills TEXT', 'archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP']
+        archive.execute(f"CREATE TABLE IF NOT EXISTS jobs ({', '.join(definitions)})")
+
+        existing = {row[1] for row in archive.execute("PRAGMA table_info(jobs)")}
+        for name, column_type in hot_columns:
+            if name not in existing:
+                archive.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+
+        archive.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_jobs_scrapped ON jobs (scrapped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_platform ON jobs (platform, scrapped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_url_platform ON jobs (url, platform);
+        ''')
+        return archive
+
+    def enable_incremental_vacuum(self, db_manager: DatabaseManager) -> bool:
+        """Switch an existing database to incremental vacuum with one full VACUUM
+
+        Returns True if the database had to be rebuilt.
+        """
+        conn = db_manager.conn
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        conn.commit()
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        return True
+
+    def maintain(self, db_manager: DatabaseManager) -> Dict[str, Any]:
+        """Release free pages, refresh planner statistics and truncate the WAL"""
+        conn = db_manager.conn
+        conn.commit()
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            pragma = "PRAGMA incremental_vacuum"
+            if self.vacuum_pages:
+                pragma += f"({int(self.vacuum_pages)})"
+            # execute() steps the pragma once, which frees a single page;
+            # executescript runs it to completion
+            conn.executescript(pragma + ";")
+
+        # Sample large indexes rather than reading them in full
+        conn.execute("PRAGMA analysis_limit = 1000")
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+        return {
+            'freed_pages': free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0],
+            'db_bytes': os.path.getsize(self.db_name),
+        }
+
+
+def _compress(value: Any) -> Optional[bytes]:
+    if value is None:
+        return None
+    return zlib.compress(str(value).encode('utf-8'))
@@ -0,0 +1,181 @@
+import re
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .models import Job
+
+
+CURRENCY_SYMBOLS = {
+    '$': 'USD', '€': 'EUR', '£': 'GBP', '₦': 'NGN', '₹': 'INR', '¥': 'JPY',
+    '₵': 'GHS', 'R$': 'BRL', 'KSh': 'KES'
+}
+CURRENCY_CODES = {
+    'USD', 'EUR', 'GBP', 'NGN', 'INR', 'JPY', 'GHS', 'BRL', 'KES', 'ZAR', 'CAD', 'AUD',
+    'CHF', 'SEK', 'NOK', 'DKK', 'PLN', 'AED', 'EGP', 'MAD', 'SGD', 'CNY', 'MXN'
+}
+
+# Periods and how many of them make up a year of full-time work
+PERIODS_PER_YEAR = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+PERIOD_RE = [
+    ('hour', re.compile(r'(?:\b(?:per|an?)\s+hour|\bhourly|/\s*h(?:ou)?r|\bp/?h)\b', re.IGNORECASE)),
+    ('day', re.compile(r'(?:\b(?:per|a)\s+day|\bdaily|/\s*day)\b', re.IGNORECASE)),
+    ('week', re.compile(r'(?:\b(?:per|a)\s+week|\bweekly|/\s*w(?:ee)?k)\b', re.IGNORECASE)),
+    ('month', re.compile(r'(?:\b(?:per|a)\s+month|\bmonthly|/\s*mo(?:nth)?|\bp/?m|\bpcm)\b', re.IGNORECASE)),
+    ('year', re.compile(r'(?:\b(?:per|a|an)\s+(?:year|annum)|\byearly|\bannual(?:ly)?|/\s*y(?:ea)?r|/\s*annum)\b'
+                        r'|\bp\.?a\b\.?', re.IGNORECASE)),
+]
+
+AMOUNT_RE = re.compile(r'(\d+(?:[.,]\d+)*)\s*([kKmM])?(?![a-zA-Z])')
+_SYMBOLS = '|'.join(re.escape(symbol) for symbol in sorted(CURRENCY_SYMBOLS, key=len, reverse=True))
+# Currency right before or after an amount marks it as money, unlike "25 days"
+CURRENCY_BEFORE_RE = re.compile(rf'(?:{_SYMBOLS}|\b[A-Z]{{3}})\s?$')
+CURRENCY_AFTER_RE = re.compile(r'^\s?[A-Z]{3}\b')
+# What joins the two bounds of a range, e.g. "$50k - $70k", "50 to 70k"
+RANGE_SEP_RE = re.compile(rf'\s*(?:-|–|—|to|To|TO)\s*(?:{_SYMBOLS}|[A-Z]{{3}})?\s*')
+UP_TO_RE = re.compile(r'\b(?:up\s+to|max(?:imum)?|below)\b', re.IGNORECASE)
+FROM_RE = re.compile(r'\b(?:from|min(?:imum)?|starting\s+at|at\s+least)\b|\d\s*[kKmM]?\s*\+', re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class SalaryRange:
+    """A salary normalized from free text; either bound may be open"""
+    min: Optional[float]
+    max: Optional[float]
+    currency: Optional[str]
+    period: Optional[str]
+
+
+def _parse_amount(number: str, suffix: Optional[str]) -> float:
+    if re.fullmatch(r'\d{1,3}(?:,\d{3})+(?:\.\d+)?', number):
+        value = float(number.replace(',', ''))
+    elif re.fullmatch(r'\d{1,3}(?:\.\d{3})+', number):
+        # European thousands separators, e.g. 45.000
+        value = float(number.replace('.', ''))
+    else:
+        value = float(number.replace(',', '.'))
+
+    if suffix:
+        value *= 1000 if suffix.lower() == 'k' else 1000000
+    return value
+
+
+def _parse_currency(text: str) -> Optional[str]:
+    for code in re.findall(r'\b[A-Z]{3}\b', text):
+        if code in CURRENCY_CODES:
+            return code
+    # Longest symbols first so R$ wins over $
+    for symbol in sorted(CURRENCY_SYMBOLS, key=len, reverse=True):
+        if re.search(re.escape(symbol) + r'\s?\d', text):
+            return CURRENCY_SYMBOLS[symbol]
+    return None
+
+
+def parse_salary(text: Optional[str]) -> Optional[SalaryRange]:
+    """Normalize salary text such as '₦300k - ₦450k monthly' or 'Up to $120,000 a year'
+
+    Returns None when the text holds no amount, e.g. 'Competitive'.
+    """
+    if not text:
+        return None
+
+    amounts = _salary_amounts(text)
+    if not amounts:
+        return None
+
+    # "50-70k" carries the suffix on the upper bound only
+    if len(amounts) >= 2 and amounts[0] < 1000 <= amounts[1] and amounts[1] / amounts[0] >= 500:
+        amounts[0] *= 1000
+
+    low, high = (min(amounts[:2]), max(amounts[:2])) if len(amounts) >= 2 else (amounts[0], amounts[0])
+    if len(amounts) == 1:
+        if UP_TO_RE.search(text):
+            low = None
+        elif FROM_RE.search(text):
+            high = None
+
+    period = None
+    for name, pattern in PERIOD_RE:
+        if pattern.search(text):
+            period = name
+            break
+
+    return SalaryRange(low, high, _parse_currency(text), period)
+
+
+def _salary_amounts(text: str) -> List[float]:
+    """The amount, or range bounds, of the salary in text
+
+    Other numbers are ignored: "$80,000 annually, 25 days PTO" is 80000.
+    The salary is the first amount marked as money by a currency or a k/m
+    suffix (else the first amount), plus the amount it forms a range with.
+    """
+    matches = [match for match in AMOUNT_RE.finditer(text) if _parse_amount(*match.groups()) > 0]
+    if not matches:
+        return []
+
+    def is_money(match: re.Match) -> bool:
+        return bool(match.group(2) or CURRENCY_BEFORE_RE.search(text[:match.start()])
+                    or CURRENCY_AFTER_RE.search(text[match.end():]))
+
+    def joined(first: re.Match, second: re.Match) -> bool:
+        return RANGE_SEP_RE.fullmatch(text[first.end():second.start()]) is not None
+
+    i = next((i for i, match in enumerate(matches) if is_money(match)), 0)
+    bounds = [matches[i]]
+    if i > 0 and joined(matches[i - 1], matches[i]):
+        bounds.insert(0, matches[i - 1])
+    elif i + 1 < len(matches) and joined(matches[i], matches[i + 1]):
+        bounds.append(matches[i + 1])
+    return [_parse_amount(*match.groups()) for match in bounds]
+
+
+class SalaryNormalizer:
+    """Parses job salaries and converts them to annual amounts in one currency
+
+    rates maps currency codes to units per base currency, e.g. with base USD
+    {"NGN": 1550.0, "EUR": 0.92}. Salaries in currencies without a rate, or
+    without a currency and no default_currency, keep their parsed values but
+    get no base amount. Amounts without a period are taken as default_period.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, base_currency: str = 'USD',
+                 default_period: str = 'year', default_currency: Optional[str] = None):
+        self.rates = dict(rates or {})
+        self.rates[base_currency] = 1.0
+        self.base_currency = base_currency
+        self.default_period = default_period
+        # Assumed for salaries without a currency, e.g. the currency of a local board
+        self.default_currency = default_currency
+
+    @classmethod
+    def from_file(cls, path: str, base_currency: str = 'USD') -> 'SalaryNormalizer':
+        """Load a {"CODE": rate} table from a JSON file"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), base_currency)
+
+    def apply(self, job: Job) -> None:
+        """Fill the parsed salary fields of a job, once"""
+        if job.salary_min is not None or job.salary_max is not None or not job.salary:
+            return
+        salary = parse_salary(job.salary)
+        if salary:
+            job.salary_min = salary.min
+            job.salary_max = salary.max
+            job.salary_currency = salary.currency
+            job.salary_period = salary.period
+
+    def to_base(self, amount: Optional[float], currency: Optional[str],
+                period: Optional[str]) -> Optional[float]:
+        """Annual amount in the base currency, or None if it cannot be converted"""
+        if amount is None:
+            return None
+        rate = self.rates.get(currency or self.default_currency)
+        if not rate:
+            return None
+        return round(amount * PERIODS_PER_YEAR[period or self.default_period] / rate, 2)
+
+    def base_range(self, job: Job) -> Tuple[Optional[float], Optional[float]]:
+        """(min, max) annual salary of a job in the base currency"""
+        return (self.to_base(job.salary_min, job.salary_currency, job.salary_period),
+                self.to_base(job.salary_max, job.salary_currency, job.salary_period))
@@ -0,0 +1,234 @@
+import json
+import os
+import time
+import heapq
+import queue
+import threading
+from typing import Dict, Any, List, Optional
+
+from .factory import ScrapperFactory
+from .orchestrator import JobScrapperOrchestrator
+from .store import JobStore
+
+
+class ScheduledSearch:
+    """A recurring search and what the scheduler has learned about it"""
+
+    def __init__(self, platform: str, search_params: Dict[str, Any],
+                 filter_params: Optional[Dict[str, Any]] = None, max_pages: int = 3,
+                 interval: float = 3600):
+        self.platform = platform
+        self.search_params = search_params
+        self.filter_params = filter_params or {}
+        self.max_pages = max_pages
+        self.interval = interval
+        self.new_job_rate = None  # smoothed new jobs per hour
+        self.last_run = None
+        self.next_run = time.time()
+        self.runs = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.platform}:{json.dumps(self.search_params, sort_keys=True)}"
+
+    def __lt__(self, other):
+        return self.next_run < other.next_run
+
+
+class RecrawlScheduler:
+    """Long-running recrawl loop with adaptive per-search intervals
+
+    Each search is rescheduled so that a run is expected to find about
+    target_new_jobs new jobs: searches producing jobs quickly are crawled
+    more often, dead ones back off towards max_interval. At most
+    concurrency searches run at once, and every worker thread keeps its
+    orchestrators (browser and database connection) warm between runs.
+    """
+
+    def __init__(self, concurrency: int = 2, min_interval: float = 15 * 60,
+                 max_interval: float = 24 * 3600, target_new_jobs: float = 5,
+                 smoothing: float = 0.3, state_file: Optional[str] = 'scheduler_state.json',
+                 store: Optional[JobStore] = None):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new_jobs = target_new_jobs
+        self.smoothing = smoothing
+        self.state_file = state_file
+        # Without a shared store each platform writes to its own {platform}_jobs.db
+        self.store = store
+
+        self.searches: Dict[str, ScheduledSearch] = {}
+        self._heap: List[ScheduledSearch] = []
+        self._work = queue.Queue()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._state = self._load_state()
+
+    def add_search(self, platform: str, search_params: Dict[str, Any],
+                   filter_params: Optional[Dict[str, Any]] = None, max_pages: int = 3) -> ScheduledSearch:
+        """Register a recurring search, restoring its learned schedule if known
+
+        Raises ValueError for an unsupported platform, so a bad searches file
+        fails at startup rather than on every run.
+        """
+        ScrapperFactory.create_scraper(platform)
+        search = ScheduledSearch(platform, search_params, filter_params, max_pages,
+                                 interval=self.min_interval)
+        saved = self._state.get(search.key)
+        if saved:
+            search.interval = saved['interval']
+            search.new_job_rate = saved['new_job_rate']
+            search.last_run = saved['last_run']
+            search.runs = saved['runs']
+            search.next_run = (search.last_run or 0) + search.interval
+
+        self.searches[search.key] = search
+        heapq.heappush(self._heap, search)
+        return search
+
+    def run_forever(self):
+        """Dispatch due searches until stop() is called or Ctrl+C"""
+        workers = [
+            threading.Thread(target=self._worker, name=f'recrawl-{i}', daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while not self._stop.is_set():
+                self._dispatch_due()
+                self._wakeup.wait(self._seconds_until_next())
+                self._wakeup.clear()
+        except KeyboardInterrupt:
+            print("Stopping scheduler...")
+        finally:
+            self._stop.set()
+            for _ in workers:
+                self._work.put(None)
+            for worker in workers:
+                worker.join()
+            self._save_state()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def _dispatch_due(self):
+        now = time.time()
+        with self._lock:
+            while self._heap and self._heap[0].next_run <= now:
+                search = heapq.heappop(self._heap)
+                self._work.put(search)
+
+    def _seconds_until_next(self) -> float:
+        with self._lock:
+            if not self._heap:
+                return 60
+            return max(0.0, min(60, self._heap[0].next_run - time.time()))
+
+    def _worker(self):
+        # Orchestrators are per thread: sqlite connections and WebDriver
+        # sessions must stay on the thread that created them.
+        orchestrators: Dict[str, JobScrapperOrchestrator] = {}
+        try:
+            while True:
+                search = self._work.get()
+                if search is None:
+                    break
+                try:
+                    new_jobs = self._run_search(search, orchestrators)
+                except Exception as e:
+                    # Keep the worker alive; the search backs off like an empty run
+                    print(f"[scheduler] {search.key} failed: {e}")
+                    orchestrator = orchestrators.pop(search.platform, None)
+                    if orchestrator is not None:
+                        try:
+                            orchestrator.cleanup()
+                        except Exception as e:
+                            print(f"[scheduler] cleanup after {search.key} failed: {e}")
+                    new_jobs = 0
+                self._reschedule(search, new_jobs)
+        finally:
+            for orchestrator in orchestrators.values():
+                orchestrator.cleanup()
+
+    def _run_search(self, search: ScheduledSearch, orchestrators: Dict[str, JobScrapperOrchestrator]) -> int:
+        orchestrator = orchestrators.get(search.platform)
+        if orchestrator is None:
+            scraper = ScrapperFactory.create_scraper(search.platform)
+            orchestrator = JobScrapperOrchestrator(scraper, f'{search.platform}_jobs.db',
+                                                   keep_alive=True, store=self.store)
+            orchestrators[search.platform] = orchestrator
+
+        orchestrator.reset_stats()
+        orchestrator.set_filter_criteria(**search.filter_params)
+        new_jobs = orchestrator.scrape_jobs(search.search_params, search.max_pages)
+
+        if not orchestrator.healthy:
+            # Drop a broken browser session; the next run starts a fresh one
+            orchestrator.cleanup()
+            del orchestrators[search.platform]
+
+        return new_jobs
+
+    def _reschedule(self, search: ScheduledSearch, new_jobs: int):
+        """Adapt the search interval to its observed new-job rate"""
+        now = time.time()
+        with self._lock:
+            hours = max((now - (search.last_run or now - search.interval)) / 3600, 1 / 60)
+            observed = new_jobs / hours
+            if search.new_job_rate is None:
+                search.new_job_rate = observed
+            else:
+                search.new_job_rate = (self.smoothing * observed
+                                       + (1 - self.smoothing) * search.new_job_rate)
+
+            if search.new_job_rate > 0:
+                ideal = self.target_new_jobs / search.new_job_rate * 3600
+            else:
+                ideal = search.interval * 2
+
+            # Move at most 2x per run so a single noisy run cannot swing it
+            interval = min(max(ideal, search.interval / 2), search.interval * 2)
+            search.interval = min(max(interval, self.min_interval), self.max_interval)
+
+            search.last_run = now
+            search.next_run = now + search.interval
+            search.runs += 1
+            heapq.heappush(self._heap, search)
+
+            print(f"[scheduler] {search.key}: {new_jobs} new, "
+                  f"{search.new_job_rate:.2f}/h, next run in {search.interval / 60:.0f} min")
+            self._save_state()
+
+        self._wakeup.set()
+
+    def _load_state(self) -> Dict[str, Any]:
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not load scheduler state: {e}")
+            return {}
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        state = {
+            key: {
+                'interval': search.interval,
+                'new_job_rate': search.new_job_rate,
+                'last_run': search.last_run,
+                'runs': search.runs
+            }
+            for key, search in self.searches.items()
+        }
+        tmp_path = self.state_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
@@ -0,0 +1,70 @@
+import os
+import re
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+
+DEFAULT_TAXONOMY = os.path.join(os.path.dirname(__file__), 'skills_taxonomy.json')
+
+# Words keep +, # and inner dots or dashes so c++, c#, node.js and .net survive
+TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class SkillMatcher:
+    """Finds taxonomy skills in free text
+
+    Every skill name and alias is tokenized once into a dict keyed by its
+    token tuple, so matching is one dict lookup per token and phrase length,
+    independent of how many thousands of skills the taxonomy holds.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        self._phrases: Dict[Tuple[str, ...], str] = {}
+        for skill, aliases in taxonomy.items():
+            for name in [skill] + list(aliases):
+                tokens = tuple(tokenize(name))
+                if tokens:
+                    self._phrases[tokens] = skill.lower()
+        self._max_len = max((len(tokens) for tokens in self._phrases), default=0)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_TAXONOMY) -> 'SkillMatcher':
+        """Load a {"skill": ["alias", ...]} taxonomy from a JSON file"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def extract(self, text: Optional[str]) -> Set[str]:
+        """Return the canonical skills mentioned in text"""
+        if not text:
+            return set()
+
+        tokens = tokenize(text)
+        skills = set()
+        i = 0
+        while i < len(tokens):
+            # Prefer the longest phrase, e.g. "spring boot" over "spring"
+            for length in range(min(self._max_len, len(tokens) - i), 0, -1):
+                skill = self._phrases.get(tuple(tokens[i:i + length]))
+                if skill:
+                    skills.add(skill)
+                    i += length
+                    break
+            else:
+                i += 1
+
+        return skills
+
+
+_default_matcher = None
+
+
+def default_matcher() -> SkillMatcher:
+    """The matcher for the bundled taxonomy, built once per process"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher.from_file()
+    return _default_matcher
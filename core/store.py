@@ -0,0 +1,204 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, Set
+
+from .database import DatabaseManager
+from .models import Job
+
+
+class JobStore:
+    """Thread-safe job store over one consolidated SQLite database
+
+    Reads go through a connection per thread. All writes are funneled
+    through a single writer thread that commits them in batches, so any
+    number of scraper threads can share the store without "database is
+    locked" errors. Other processes can use their own JobStore on the same
+    file: WAL mode and the busy timeout serialize them at the SQLite level.
+    """
+
+    def __init__(self, db_name: str = 'jobs.db', batch_size: int = 200, timeout: float = 30.0):
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._readers: List[DatabaseManager] = []
+        self._readers_lock = threading.Lock()
+        # Items are (jobs, future) inserts or (func, future) writer calls
+        self._queue = queue.Queue()
+
+        # Create the schema before any reader or the writer touches it
+        self._writer_db = DatabaseManager(db_name, timeout=timeout, check_same_thread=False)
+        self._writer = threading.Thread(target=self._write_loop, name='job-store-writer', daemon=True)
+        self._writer.start()
+
+    def _reader(self) -> DatabaseManager:
+        """The calling thread's own read connection"""
+        db_manager = getattr(self._local, 'db_manager', None)
+        if db_manager is None:
+            # check_same_thread is off only so close() can run from another thread
+            db_manager = DatabaseManager(self.db_name, timeout=self.timeout, check_same_thread=False)
+            self._local.db_manager = db_manager
+            with self._readers_lock:
+                self._readers.append(db_manager)
+        return db_manager
+
+    @property
+    def conn(self):
+        """Read connection of the calling thread, for JobQuery and friends"""
+        return self._reader().conn
+
+    def job_exists(self, url: str, platform: str) -> bool:
+        """Check if job already exist in database"""
+        return self._reader().job_exists(url, platform)
+
+    def existing_urls(self, platform: str, urls: List[str]) -> Set[str]:
+        """The urls already stored for a platform"""
+        return self._reader().existing_urls(platform, urls)
+
+    def insert_job(self, job: Union[Job, Dict[str, Any]]) -> bool:
+        """Queue a job for the writer and wait until it is committed"""
+        return self.insert_jobs([job]) == 1
+
+    def insert_jobs(self, jobs: List[Union[Job, Dict[str, Any]]]) -> int:
+        """Queue jobs for the writer and wait; returns the number inserted"""
+        jobs = [Job.from_dict(job) if isinstance(job, dict) else job for job in jobs]
+        future = Future()
+        self._queue.put((jobs, future))
+        return future.result()
+
+    def upsert_company(self, platform: str, name: str, **fields) -> int:
+        """Insert or refresh a company record through the writer; returns its id"""
+        return self._call_writer(lambda db_manager: db_manager.upsert_company(platform, name, **fields))
+
+    def get_company(self, platform: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return a company record"""
+        return self._reader().get_company(platform, name)
+
+    def mark_seen(self, platform: str, urls: List[str]) -> int:
+        """Set last_seen on known jobs through the writer"""
+        return self._call_writer(lambda db_manager: db_manager.mark_seen(platform, urls))
+
+    def refresh_jobs(self, jobs: List[Job]) -> int:
+        """Set last_seen and store changed listing fields through the writer"""
+        return self._call_writer(lambda db_manager: db_manager.refresh_jobs(jobs))
+
+    def expire_jobs(self, platform: str, urls: List[str]) -> int:
+        """Mark jobs gone from their board as expired through the writer"""
+        return self._call_writer(lambda db_manager: db_manager.expire_jobs(platform, urls))
+
+    def get_board_state(self, platform: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the crawl state of a company board"""
+        return self._reader().get_board_state(platform, url)
+
+    def save_board_state(self, platform: str, url: str, **state):
+        """Record a company board check through the writer"""
+        return self._call_writer(lambda db_manager: db_manager.save_board_state(platform, url, **state))
+
+    def _call_writer(self, func: Callable[[DatabaseManager], Any]) -> Any:
+        """Run func on the writer thread's connection and wait for its result"""
+        future = Future()
+        self._queue.put((func, future))
+        return future.result()
+
+    def _write_loop(self):
+        item = None
+        while True:
+            if item is None:
+                item = self._queue.get()
+            if item is None:
+                break
+
+            if callable(item[0]):
+                self._run_call(*item)
+                item = None
+                continue
+
+            # Group whatever job inserts are already waiting into the same
+            # transaction; anything else is handled after the batch.
+            batch = [item]
+            pending = len(item[0])
+            item = None
+            stop = False
+            while pending < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if callable(item[0]):
+                    break
+                batch.append(item)
+                pending += len(item[0])
+                item = None
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Keep the writer alive: callers wait on these futures
+                print(f"Database error: {e}")
+                if self._writer_db.conn.in_transaction:
+                    self._writer_db.conn.rollback()
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            if stop:
+                break
+
+    def _run_call(self, func: Callable[[DatabaseManager], Any], future: Future):
+        try:
+            future.set_result(func(self._writer_db))
+        except Exception as e:
+            if self._writer_db.conn.in_transaction:
+                self._writer_db.conn.rollback()
+            future.set_exception(e)
+
+    def _write_batch(self, batch: List[Tuple[List[Job], Future]]):
+        db_manager = self._writer_db
+        results = []
+        seen = set()
+
+        # Re-check duplicates inside a write transaction: the writer thread
+        # serializes this process and BEGIN IMMEDIATE locks out other
+        # processes, so the check and the insert cannot race.
+        db_manager.conn.execute("BEGIN IMMEDIATE")
+        for jobs, _ in batch:
+            fresh = []
+            for job in jobs:
+                key = (job.url, job.platform)
+                if job.url and (key in seen or db_manager.job_exists(job.url, job.platform)):
+                    continue
+                seen.add(key)
+                fresh.append(job)
+            results.append(fresh)
+
+        all_jobs = [job for fresh in results for job in fresh]
+        try:
+            inserted = db_manager.insert_jobs(all_jobs)
+        except Exception:
+            inserted = None
+        if inserted == len(all_jobs):
+            for (_, future), fresh in zip(batch, results):
+                future.set_result(len(fresh))
+            return
+
+        # The batch was rolled back; retry each request on its own so one
+        # bad record does not fail the others.
+        for (_, future), fresh in zip(batch, results):
+            try:
+                future.set_result(db_manager.insert_jobs(fresh))
+            except Exception as e:
+                future.set_exception(e)
+
+    def close(self):
+        """Flush pending writes and close every connection"""
+        self._queue.put(None)
+        self._writer.join()
+        self._writer_db.close()
+        with self._readers_lock:
+            for db_manager in self._readers:
+                db_manager.close()
+            self._readers = []
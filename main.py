@@ -1,14 +1,38 @@
+import sys
 from core.orchestrator import JobScrapperOrchestrator
+from core.factory import ScrapperFactory
+from core.page_cache import PageCache
+from core.archive import PageArchive
+from core.backfill import backfill_from_archive
+from core.profiling import profile_run
+from core.scheduler import RecrawlScheduler
+from core.store import JobStore
+from core.boards import CompanyBoardCrawler
+from core.database import DatabaseManager
+from core.queries import JobQuery
+from core.retention import RetentionManager
+from core.planner import SearchPlanner
+from core.skills import SkillMatcher
+from core.salary import SalaryNormalizer
+from concurrent.futures import ThreadPoolExecutor
+import json
 from typing import Dict, Any
 
 
 def scrape_singl_platform(platform: str, search_params: Dict[str, Any],
-                          filter_params: Dict[str, Any] = None, max_pages: int = 5):
-    """Scrape jobs from a single platform"""
+                          filter_params: Dict[str, Any] = None, max_pages: int = 5,
+                          page_cache: PageCache = None, page_archive: PageArchive = None,
+                          store: JobStore = None):
+    """Scrape jobs from a single platform
+
+    Jobs go to {platform}_jobs.db unless a shared JobStore is given.
+    """
     try:
         # Create platform scraper
         scraper = ScrapperFactory.create_scraper(platform)
-        orchestrator = JobScrapperOrchestrator(scraper, f'{platform}_jobs.db')
+        scraper.page_cache = page_cache
+        scraper.page_archive = page_archive
+        orchestrator = JobScrapperOrchestrator(scraper, f'{platform}_jobs.db', store=store)
 
         # Set filters if provided
         if filter_params:
@@ -22,14 +46,34 @@ def scrape_singl_platform(platform: str, search_params: Dict[str, Any],
         return 0
     
 def scrape_multiple_platforms(platforms: list, search_params: Dict[str, Any],
-                              filter_params: Dict[str, Any] = None, max_pages: int = 3):
-    """Scrape jobs form multiple platforms"""
+                              filter_params: Dict[str, Any] = None, max_pages: int = 3,
+                              page_cache: PageCache = None, page_archive: PageArchive = None,
+                              shared_db: str = None):
+    """Scrape jobs form multiple platforms
+
+    With shared_db all platforms are scraped concurrently into that one
+    database; otherwise they run one after another into per-platform files.
+    """
     total_scraped = 0
 
-    for platform in platforms:
-        print(f"\n{'='*20} SCRAPING {platform.upper()} {'='*20}")
-        scraped = scrape_singl_platform(platform, search_params, filter_params, max_pages)
-        total_scraped += scraped
+    if shared_db:
+        store = JobStore(shared_db)
+        try:
+            with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+                futures = [
+                    executor.submit(scrape_singl_platform, platform, search_params, filter_params,
+                                    max_pages, page_cache, page_archive, store)
+                    for platform in platforms
+                ]
+                total_scraped = sum(future.result() for future in futures)
+        finally:
+            store.close()
+    else:
+        for platform in platforms:
+            print(f"\n{'='*20} SCRAPING {platform.upper()} {'='*20}")
+            scraped = scrape_singl_platform(platform, search_params, filter_params, max_pages,
+                                            page_cache, page_archive)
+            total_scraped += scraped
 
     print(f"\n Total jobs scraped across all platforoms: {total_scraped}")
     return total_scraped
@@ -45,13 +89,206 @@ def list_available_platforms():
     return platforms
 
 
-def main():
-    """Main application entry point"""
+def backfill_platform(platform: str, archive_dir: str = 'page_archive'):
+    """Re-run detail extraction over archived pages of a platform"""
+    scraper_class = type(ScrapperFactory.create_scraper(platform))
+    return backfill_from_archive(scraper_class, platform, archive_dir, f'{platform}_jobs.db')
+
+
+def backfill_skills(db_name: str, taxonomy_file: str = None):
+    """Re-extract skills of every stored job, e.g. after a taxonomy update"""
+    skill_matcher = SkillMatcher.from_file(taxonomy_file) if taxonomy_file else None
+    db_manager = DatabaseManager(db_name, skill_matcher=skill_matcher)
+    try:
+        processed = db_manager.backfill_job_skills()
+        print(f"Extracted skills for {processed} jobs")
+        return processed
+    finally:
+        db_manager.close()
+
+
+def backfill_salaries(db_name: str, rates_file: str = None):
+    """Re-parse salaries of every stored job, e.g. after an exchange rate update"""
+    salary_normalizer = SalaryNormalizer.from_file(rates_file) if rates_file else None
+    db_manager = DatabaseManager(db_name, salary_normalizer=salary_normalizer)
+    try:
+        processed = db_manager.backfill_salaries()
+        print(f"Normalized salaries for {processed} jobs")
+        return processed
+    finally:
+        db_manager.close()
+
+
+def crawl_company_boards(boards_file: str, db_name: str = 'jobs.db',
+                         platform: str = 'workable', concurrency: str = '16'):
+    """Crawl the company boards listed in a file, one URL per line"""
+    with open(boards_file, encoding='utf-8') as f:
+        company_urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    store = JobStore(db_name)
+    try:
+        crawler = CompanyBoardCrawler(ScrapperFactory.create_scraper(platform), store,
+                                      concurrency=int(concurrency))
+        return crawler.crawl(company_urls)
+    finally:
+        store.close()
+
+
+def export_events(db_name: str, after_seq: str = '0', output_file: str = None):
+    """Write outbox events after a sequence number as JSON lines
+
+    Prints the last seq written so the next export can resume from it.
+    """
+    db_manager = DatabaseManager(db_name)
+    out = open(output_file, 'a', encoding='utf-8') if output_file else sys.stdout
+    try:
+        query = JobQuery(db_manager)
+        cursor = int(after_seq)
+        while True:
+            events, next_cursor = query.job_events(after_seq=cursor)
+            if not events:
+                break
+            for event in events:
+                out.write(json.dumps(event, ensure_ascii=False) + '\n')
+            cursor = next_cursor
+        print(f"Last event seq: {cursor}", file=sys.stderr)
+        return cursor
+    finally:
+        if output_file:
+            out.close()
+        db_manager.close()
+
+
+def rebuild_stats(db_name: str):
+    """Recount the job_stats rollup of a database from its jobs table"""
+    db_manager = DatabaseManager(db_name)
+    try:
+        rows = db_manager.rebuild_job_stats()
+        print(f"Rebuilt {rows} job stats rows")
+        return rows
+    finally:
+        db_manager.close()
+
+
+def show_stats(db_name: str, dimension: str = 'company', top: str = '20'):
+    """Print the job counts of one job_stats dimension"""
+    db_manager = DatabaseManager(db_name)
+    try:
+        stats = JobQuery(db_manager).job_stats(dimension, top=int(top))
+        for entry in stats:
+            print(f"{entry['jobs']:>8} {entry['active']:>8}  {entry['value'] or '(none)'}")
+        return stats
+    finally:
+        db_manager.close()
+
+
+def run_retention(db_name: str, horizon_days: str = '90', archive_dir: str = 'job_archive'):
+    """Archive jobs unseen for horizon_days, then vacuum and analyze the database"""
+    retention = RetentionManager(db_name, archive_dir, horizon_days=float(horizon_days))
+    stats = retention.run(convert=True)
+    print(f"Archived {stats['archived']} jobs, freed {stats['freed_pages']} pages, "
+          f"{db_name} is now {stats['db_bytes'] / 2**20:.1f}MB")
+    return stats
+
+
+def run_sharded_search(search_file: str, workers: str = '4'):
+    """Scrape a search past the board's result cap by splitting it into shards
+
+    The file holds one {"platform", "search_params", "filter_params",
+    "locations", "keywords", "result_cap", "db_name"} object.
+    """
+    with open(search_file, encoding='utf-8') as f:
+        search = json.load(f)
+
+    platform = search['platform']
+    store = JobStore(search.get('db_name', f'{platform}_jobs.db'))
+    try:
+        scraper_class = type(ScrapperFactory.create_scraper(platform))
+        planner = SearchPlanner(scraper_class, store, workers=int(workers),
+                                locations=search.get('locations'), keywords=search.get('keywords'),
+                                result_cap=search.get('result_cap'),
+                                filter_params=search.get('filter_params'))
+        return planner.run(search.get('search_params', {}))
+    finally:
+        store.close()
+
+
+def run_daemon(searches_file: str, concurrency: str = '2', horizon_days: str = '90'):
+    """Recrawl the searches listed in a JSON file on adaptive intervals
+
+    The file holds a list of {"platform", "search_params", "filter_params",
+    "max_pages"} objects. Each platform database also gets daily retention.
+    """
+    with open(searches_file, encoding='utf-8') as f:
+        searches = json.load(f)
+
+    scheduler = RecrawlScheduler(concurrency=int(concurrency))
+    for search in searches:
+        scheduler.add_search(search['platform'], search['search_params'],
+                             search.get('filter_params'), search.get('max_pages', 3))
+
+    retention = [
+        RetentionManager(f'{platform}_jobs.db', horizon_days=float(horizon_days))
+        for platform in sorted({search['platform'] for search in searches})
+    ]
+    for manager in retention:
+        manager.start()
+
+    print(f"Scheduling {len(searches)} searches with concurrency {concurrency}")
+    try:
+        scheduler.run_forever()
+    finally:
+        for manager in retention:
+            manager.stop()
+
+
+def run(argv: list):
+    """Run the command given on the command line"""
     # Example Usage
-    if len(sys.argv) > 1:
-        if sys.argv[1] == 'list':
+    if argv:
+        if argv[0] == 'list':
             list_available_platforms()
             return
+        if argv[0] == 'backfill':
+            # python main.py backfill <platform> [archive_dir]
+            backfill_platform(*argv[1:3])
+            return
+        if argv[0] == 'skills-backfill':
+            # python main.py skills-backfill <db_name> [taxonomy.json]
+            backfill_skills(*argv[1:3])
+            return
+        if argv[0] == 'salary-backfill':
+            # python main.py salary-backfill <db_name> [rates.json]
+            backfill_salaries(*argv[1:3])
+            return
+        if argv[0] == 'boards':
+            # python main.py boards <boards.txt> [db_name] [platform] [concurrency]
+            crawl_company_boards(*argv[1:5])
+            return
+        if argv[0] == 'events':
+            # python main.py events <db_name> [after_seq] [events.jsonl]
+            export_events(*argv[1:4])
+            return
+        if argv[0] == 'stats-rebuild':
+            # python main.py stats-rebuild <db_name>
+            rebuild_stats(*argv[1:2])
+            return
+        if argv[0] == 'stats':
+            # python main.py stats <db_name> [company|location|job_type|day] [top]
+            show_stats(*argv[1:4])
+            return
+        if argv[0] == 'retention':
+            # python main.py retention <db_name> [horizon_days] [archive_dir]
+            run_retention(*argv[1:4])
+            return
+        if argv[0] == 'shards':
+            # python main.py shards <search.json> [workers]
+            run_sharded_search(*argv[1:3])
+            return
+        if argv[0] == 'daemon':
+            # python main.py daemon <searches.json> [concurrency] [horizon_days]
+            run_daemon(*argv[1:4])
+            return
         
     # Define search parameters
 
@@ -59,7 +296,7 @@ def main():
     search_params = {
         'query': 'python developer',
         'location': 'remote',
-        'company_url': 'https://company.workable.com' # specific to platform
+        # 'company_url': 'https://apply.workable.com/<account>/' scrapes one company's board instead
     }
 
     # Define filter criteria
@@ -80,6 +317,27 @@ def main():
     # platforms = ['workable', 'weworkremotely', 'indeed']
     # scrape_multiple_platforms(platforms, search_params, filter_params)
 
+
+def main():
+    """Main application entry point
+
+    Any command can be run with --profile or --profile=<dir> to write a
+    cProfile dump, a folded stack file for flame graphs and a per-module
+    hot function summary (default dir: profiles).
+    """
+    argv = sys.argv[1:]
+    profile_dir = None
+
+    for arg in list(argv):
+        if arg == '--profile' or arg.startswith('--profile='):
+            argv.remove(arg)
+            profile_dir = arg.partition('=')[2] or 'profiles'
+
+    if profile_dir:
+        profile_run(run, argv, output_dir=profile_dir)
+    else:
+        run(argv)
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,202 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import multiprocessing
+from typing import Dict, Any, List, Optional
+
+from core.boards import CompanyBoardCrawler
+from core.orchestrator import JobScrapperOrchestrator
+from core.store import JobStore
+from workable_scraper import WorkableScraper
+from .server import serve, add_simulator_arguments, simulator_options
+
+
+class ResourceMonitor:
+    """Samples memory, database size and stored job count on an interval"""
+
+    def __init__(self, db_name: str, interval: float = 5.0):
+        self.db_name = db_name
+        self.interval = interval
+        self.samples: List[Dict[str, Any]] = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = None
+
+    def start(self):
+        self._start = time.time()
+        self._thread = threading.Thread(target=self._run, name='resource-monitor', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[Dict[str, Any]]:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        return self.samples
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> Dict[str, Any]:
+        jobs = _stored_jobs(self.db_name)
+        elapsed = time.time() - self._start
+        previous = self.samples[-1] if self.samples else {'elapsed': 0.0, 'jobs': 0}
+        span = elapsed - previous['elapsed']
+        sample = {
+            'elapsed': round(elapsed, 1),
+            'jobs': jobs,
+            'jobs_per_sec': round((jobs - previous['jobs']) / span, 1) if span > 0 else 0.0,
+            'rss_mb': round(_rss_bytes() / 2**20, 1),
+            'db_mb': round(_db_bytes(self.db_name) / 2**20, 1),
+        }
+        self.samples.append(sample)
+        print(f"[{sample['elapsed']:>8.1f}s] jobs={sample['jobs']} "
+              f"rate={sample['jobs_per_sec']}/s rss={sample['rss_mb']}MB db={sample['db_mb']}MB")
+        return sample
+
+
+def run_harness(mode: str = 'boards', db_name: str = 'simulation.db', concurrency: int = 16,
+                per_host: int = 8, interval: float = 5.0, passes: int = 1,
+                report_file: Optional[str] = None, **simulator) -> Dict[str, Any]:
+    """Crawl a simulated board end to end and report throughput, memory and DB growth
+
+    mode 'browser' drives JobScrapperOrchestrator through Chrome against
+    the listing and detail pages; mode 'boards' runs the HTTP-only
+    CompanyBoardCrawler over every simulated company board and is the one
+    that reaches the 100k-1M job range. The simulator runs in its own
+    process so it does not compete with the crawler for the GIL.
+    """
+    for path in (db_name, db_name + '-wal', db_name + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, kwargs=dict(port_queue=port_queue, **simulator), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+    monitor = ResourceMonitor(db_name, interval)
+    runs = []
+    monitor.start()
+    start = time.time()
+    try:
+        for _ in range(passes):
+            run_start = time.time()
+            if mode == 'browser':
+                stats = _run_browser(base_url, db_name, simulator['jobs'], simulator['page_size'])
+            else:
+                stats = _run_boards(base_url, db_name, simulator['companies'], concurrency, per_host)
+            runs.append({'elapsed': round(time.time() - run_start, 1), 'stats': stats})
+    finally:
+        elapsed = time.time() - start
+        samples = monitor.stop()
+        server.terminate()
+        server.join()
+
+    jobs = samples[-1]['jobs']
+    report = {
+        'mode': mode,
+        'simulator': simulator,
+        'elapsed': round(elapsed, 1),
+        'jobs': jobs,
+        'jobs_per_sec': round(jobs / elapsed, 1) if elapsed else 0.0,
+        'peak_rss_mb': max(sample['rss_mb'] for sample in samples),
+        'db_mb': samples[-1]['db_mb'],
+        'db_bytes_per_job': round(_db_bytes(db_name) / jobs) if jobs else None,
+        'runs': runs,
+        'samples': samples,
+    }
+
+    print("\n" + "="*50)
+    print(f"SIMULATION REPORT - {mode}")
+    print("="*50)
+    for key in ('elapsed', 'jobs', 'jobs_per_sec', 'peak_rss_mb', 'db_mb', 'db_bytes_per_job'):
+        print(f"{key.replace('_', ' ').title()}: {report[key]}")
+    for number, run in enumerate(runs, 1):
+        print(f"Pass {number}: {run['elapsed']}s {run['stats']}")
+    print("="*50)
+
+    if report_file:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+
+def _run_browser(base_url: str, db_name: str, jobs: int, page_size: int) -> Dict[str, int]:
+    scraper = WorkableScraper()
+    scraper.base_url = f"{base_url}/search"
+    orchestrator = JobScrapperOrchestrator(scraper, db_name, delay=(0, 0))
+    # Every listing batch counts as a page
+    orchestrator.scrape_jobs({}, max_pages=-(-jobs // page_size))
+    return orchestrator.stats
+
+
+def _run_boards(base_url: str, db_name: str, companies: int, concurrency: int,
+                per_host: int) -> Dict[str, int]:
+    scraper = WorkableScraper()
+    scraper.board_api_url = f"{base_url}/api/v1/widget/accounts/{{account}}"
+    store = JobStore(db_name)
+    try:
+        crawler = CompanyBoardCrawler(scraper, store, concurrency=concurrency, per_host=per_host)
+        company_urls = [f"https://apply.workable.com/company-{company_id}/" for company_id in range(companies)]
+        return crawler.crawl(company_urls)
+    finally:
+        store.close()
+
+
+def _stored_jobs(db_name: str) -> int:
+    """Highest job id, a cheap stand-in for the row count of an insert-only table"""
+    if not os.path.exists(db_name):
+        return 0
+    try:
+        conn = sqlite3.connect(db_name, timeout=5)
+        try:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM jobs").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return 0
+
+
+def _rss_bytes() -> int:
+    """Current resident memory of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        # Not Linux: fall back to the peak, which ru_maxrss reports in KB (bytes on macOS)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _db_bytes(db_name: str) -> int:
+    return sum(os.path.getsize(path) for path in (db_name, db_name + '-wal')
+               if os.path.exists(path))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Load test the scrapers against a simulated job board')
+    parser.add_argument('--mode', choices=('boards', 'browser'), default='boards')
+    parser.add_argument('--db', default='simulation.db')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=8)
+    parser.add_argument('--interval', type=float, default=5.0, help='seconds between samples')
+    parser.add_argument('--passes', type=int, default=1,
+                        help='crawl the same boards again to measure the unchanged path')
+    parser.add_argument('--report', help='write the report as JSON to this file')
+    add_simulator_arguments(parser)
+    args = parser.parse_args(argv)
+
+    run_harness(mode=args.mode, db_name=args.db, concurrency=args.concurrency,
+                per_host=args.per_host, interval=args.interval, passes=args.passes,
+                report_file=args.report, **simulator_options(args))
+
+
+if __name__ == '__main__':
+    main()
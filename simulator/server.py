@@ -0,0 +1,342 @@
+import re
+import sys
+import json
+import time
+import html
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from typing import Dict, Any, List, Optional
+
+
+TITLES = ['Python Developer', 'Backend Engineer', 'Frontend Developer', 'Data Analyst',
+          'Data Scientist', 'DevOps Engineer', 'Mobile Developer', 'QA Engineer',
+          'Product Manager', 'Customer Success Manager', 'Accountant', 'Sales Executive']
+SENIORITY = ['', 'Junior ', 'Senior ', 'Lead ']
+LOCATIONS = [('Lagos', 'Lagos', 'Nigeria'), ('Abuja', 'Federal Capital Territory', 'Nigeria'),
+             ('Nairobi', 'Nairobi County', 'Kenya'), ('Accra', 'Greater Accra', 'Ghana'),
+             ('Cape Town', 'Western Cape', 'South Africa'), ('London', 'England', 'United Kingdom')]
+WORKPLACES = ['On-site', 'Hybrid', 'Remote']
+EMPLOYMENT_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship']
+SKILLS = ['Python', 'Django', 'FastAPI', 'AWS', 'Docker', 'Kubernetes', 'PostgreSQL', 'React',
+          'TypeScript', 'SQL', 'Excel', 'Go', 'Java', 'Terraform', 'Power BI', 'Figma']
+SALARIES = [None, None, '₦300k - ₦450k monthly', '$50,000 - $70,000 per year',
+            'Up to $120k a year', '£40,000 - £55,000 p.a.', 'Competitive']
+BENEFITS = ['Health insurance', 'Remote work allowance', 'Learning budget', 'Paid time off',
+            'Pension contribution', 'Annual bonus']
+COMPANY_WORDS = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Vandelay', 'Stark',
+                 'Wayne', 'Wonka', 'Cyberdyne', 'Soylent', 'Tyrell']
+
+VIEW_RE = re.compile(r'^/view/(\d+)$')
+BOARD_RE = re.compile(r'^/api/v1/widget/accounts/([\w-]+)$')
+
+
+class JobBoardSimulator:
+    """Deterministic synthetic job board with a Workable-like DOM
+
+    Job i is generated from (seed, i) on every request, so a board with a
+    million jobs costs no memory. Jobs belong to `companies` companies,
+    whose boards are also served as JSON in the shape of Workable's
+    widget API.
+    """
+
+    def __init__(self, jobs: int = 10000, companies: int = 100, page_size: int = 10, seed: int = 0):
+        self.jobs = jobs
+        self.companies = max(1, min(companies, jobs))
+        self.page_size = page_size
+        self.seed = seed
+
+    def job(self, job_id: int) -> Dict[str, Any]:
+        """The synthetic job with the given id"""
+        rng = random.Random(self.seed * 1000003 + job_id)
+        company_id = job_id % self.companies
+        city, state, country = rng.choice(LOCATIONS)
+        return {
+            'id': job_id,
+            'title': rng.choice(SENIORITY) + rng.choice(TITLES),
+            'company_id': company_id,
+            'company': self.company_name(company_id),
+            'account': self.account(company_id),
+            'city': city,
+            'state': state,
+            'country': country,
+            'location': f"{city}, {state}, {country}",
+            'workplace': rng.choice(WORKPLACES),
+            'employment_type': rng.choice(EMPLOYMENT_TYPES),
+            'posted_days': rng.randint(0, 30),
+            'skills': rng.sample(SKILLS, 4),
+            'salary': rng.choice(SALARIES),
+            'benefits': rng.sample(BENEFITS, 3),
+            'paragraphs': rng.randint(2, 5),
+        }
+
+    def company_name(self, company_id: int) -> str:
+        return f"{COMPANY_WORDS[company_id % len(COMPANY_WORDS)]} {company_id}"
+
+    def account(self, company_id: int) -> str:
+        return f"company-{company_id}"
+
+    def company_job_ids(self, company_id: int) -> range:
+        return range(company_id, self.jobs, self.companies)
+
+    def search_page(self) -> str:
+        """Listings page with the first batch of jobs and a 'Show more' button"""
+        items = self.list_items(0)
+        load_more = ''
+        if self.page_size < self.jobs:
+            load_more = (f'<button data-ui="load-more-button" data-offset="{self.page_size}" '
+                         f'onclick="loadMore(this)">Show more</button>')
+        return f'''<!DOCTYPE html>
+<html><head><title>Jobs</title></head><body>
+<div data-ui="cookie-consent"><button data-ui="cookie-consent-accept"
+    onclick="this.parentNode.remove()">Accept</button></div>
+<span data-ui="jobs-list-title"><strong class="styles__strong--2mCQz">{self.jobs} jobs</strong></span>
+<ul class="jobsList__list--1sJFq" data-ui="jobs-list">{items}</ul>
+{load_more}
+<script>
+function loadMore(button) {{
+  fetch('/search/items?offset=' + button.dataset.offset)
+    .then(function (r) {{ if (!r.ok) throw new Error(r.status); return r.text(); }})
+    .then(function (items) {{
+      document.querySelector('[data-ui="jobs-list"]').insertAdjacentHTML('beforeend', items);
+      var offset = Number(button.dataset.offset) + {self.page_size};
+      if (offset >= {self.jobs}) button.remove(); else button.dataset.offset = offset;
+    }});
+}}
+</script>
+</body></html>'''
+
+    def list_items(self, offset: int) -> str:
+        """Job cards for one batch of listings"""
+        cards = []
+        for job_id in range(offset, min(offset + self.page_size, self.jobs)):
+            job = self.job(job_id)
+            cards.append(
+                f'<li class="jobsList__list-item--3HLIF" data-ui="job-item">'
+                f'<a href="/view/{job_id}" data-ui="job-link">'
+                f'<h2 data-ui="job-title">{html.escape(job["title"])}</h2></a>'
+                f'<p data-ui="job-company">{html.escape(job["company"])}</p>'
+                f'<span data-ui="job-location">{html.escape(job["location"])}</span>'
+                f'<span data-ui="job-type">{job["employment_type"]}</span>'
+                f'<span data-ui="job-workplace">{job["workplace"]}</span>'
+                f'<span data-ui="job-posted">{_posted(job["posted_days"])}</span></li>'
+            )
+        return ''.join(cards)
+
+    def detail_page(self, job_id: int) -> str:
+        """Job detail page with the overview and description sections"""
+        job = self.job(job_id)
+        posted = _posted(job['posted_days'])
+        return f'''<!DOCTYPE html>
+<html><head><title>{html.escape(job["title"])}</title></head><body>
+<div class="jobOverview__job-overview--2bZmu">
+  <div class="companyLogo__container--26Pxz">
+    <img class="companyLogo__logo--3pCN0" src="/logos/{job["account"]}.png"></div>
+  <h2 class="jobOverview__job-title--kuTAQ"><strong>{html.escape(job["title"])}</strong></h2>
+  <h3 class="jobOverview__company--2KjRf"><a href="/company/{job["account"]}">{html.escape(job["company"])}</a></h3>
+  <span data-ui="overview-workplace"><strong>{job["workplace"]}</strong></span>
+  <span data-ui="overview-employment-type">{job["employment_type"]}</span>
+  <span data-ui="overview-location">{html.escape(job["location"])}</span>
+  <span data-ui="overview-date-posted">{posted}</span>
+</div>
+<div class="jobBreakdown__job-breakdown--31MGR">
+  <section><h3>Description</h3>
+    <div class="parsedHtml__content--OWD2W">{self._description_html(job)}</div></section>
+  <section><h3>Requirements</h3>
+    <div class="parsedHtml__content--OWD2W">{self._requirements_html(job)}</div></section>
+  <section><h3>Benefits</h3>
+    <div class="parsedHtml__content--OWD2W">{self._benefits_html(job)}</div></section>
+</div>
+</body></html>'''
+
+    def board(self, company_id: int, base_url: str) -> Dict[str, Any]:
+        """A company board in the shape of Workable's widget API"""
+        jobs = []
+        for job_id in self.company_job_ids(company_id):
+            job = self.job(job_id)
+            jobs.append({
+                'title': job['title'],
+                'shortcode': f"SIM{job_id}",
+                'employment_type': job['employment_type'],
+                'telecommuting': job['workplace'] == 'Remote',
+                'url': f"{base_url}/view/{job_id}",
+                'published_on': time.strftime('%Y-%m-%d', time.gmtime(time.time() - job['posted_days'] * 86400)),
+                'city': job['city'],
+                'state': job['state'],
+                'country': job['country'],
+                'description': self._description_html(job),
+                'requirements': self._requirements_html(job),
+                'benefits': self._benefits_html(job),
+            })
+        return {'name': self.company_name(company_id), 'jobs': jobs}
+
+    def _description_html(self, job: Dict[str, Any]) -> str:
+        paragraphs = [
+            f"<p>{html.escape(job['company'])} is hiring a {html.escape(job['title'])} "
+            f"to join the team in {job['city']}. You will build and run systems used by "
+            f"thousands of customers every day.</p>"
+        ] * job['paragraphs']
+        if job['salary']:
+            paragraphs.append(f"<p><strong>Salary</strong></p><p>{html.escape(job['salary'])}</p>")
+        return ''.join(paragraphs)
+
+    def _requirements_html(self, job: Dict[str, Any]) -> str:
+        items = ''.join(f"<li>Experience with {skill}</li>" for skill in job['skills'])
+        return f"<ul>{items}</ul>"
+
+    def _benefits_html(self, job: Dict[str, Any]) -> str:
+        return '<ul>' + ''.join(f"<li>{benefit}</li>" for benefit in job['benefits']) + '</ul>'
+
+
+def _posted(days: int) -> str:
+    """'Posted N days ago' text shown on cards and detail pages"""
+    return 'Posted today' if days == 0 else f"Posted {days} day{'s' if days > 1 else ''} ago"
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """Serves a JobBoardSimulator with injected latency, errors and 429s"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(random.uniform(0, 2 * server.latency))
+
+        roll = random.random()
+        if roll < server.rate_limit_rate:
+            self._send(429, 'Too Many Requests', 'text/plain', {'Retry-After': str(server.retry_after)})
+            return
+        if roll < server.rate_limit_rate + server.error_rate:
+            self._send(500, 'Internal Server Error', 'text/plain')
+            return
+
+        board = server.board
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/') or '/'
+        query = parse_qs(parts.query)
+
+        if path in ('/', '/search'):
+            self._send(200, board.search_page())
+        elif path == '/search/items':
+            offset = int(query.get('offset', ['0'])[0])
+            self._send(200, board.list_items(offset))
+        elif VIEW_RE.match(path):
+            job_id = int(VIEW_RE.match(path).group(1))
+            if job_id >= board.jobs:
+                self._send(404, 'Not Found', 'text/plain')
+            else:
+                self._send(200, board.detail_page(job_id))
+        elif BOARD_RE.match(path):
+            self._send_board(BOARD_RE.match(path).group(1))
+        else:
+            self._send(404, 'Not Found', 'text/plain')
+
+    def _send_board(self, account: str):
+        board = self.server.board
+        try:
+            company_id = int(account.rsplit('-', 1)[1])
+        except (IndexError, ValueError):
+            company_id = -1
+        if not 0 <= company_id < board.companies:
+            self._send(404, 'Not Found', 'text/plain')
+            return
+
+        # Boards never change for a given configuration
+        etag = f'"{board.seed}-{board.jobs}-{board.companies}-{company_id}"'
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, '', 'text/plain', {'ETag': etag})
+            return
+        base_url = f"http://{self.headers.get('Host')}"
+        body = json.dumps(board.board(company_id, base_url))
+        self._send(200, body, 'application/json', {'ETag': etag})
+
+    def _send(self, status: int, body: str, content_type: str = 'text/html',
+              headers: Optional[Dict[str, str]] = None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(data)
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    """HTTP server for a simulated board
+
+    latency is the mean delay per request in seconds; error_rate and
+    rate_limit_rate are the fractions of requests answered with a 500 or
+    a 429 carrying Retry-After.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, board: JobBoardSimulator, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: float = 1.0):
+        super().__init__((host, port), SimulatorHandler)
+        self.board = board
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'SimulatorServer':
+        """Serve from a daemon thread"""
+        threading.Thread(target=self.serve_forever, name='job-board-simulator', daemon=True).start()
+        return self
+
+
+def serve(port_queue=None, host: str = '127.0.0.1', port: int = 0, jobs: int = 10000,
+          companies: int = 100, page_size: int = 10, seed: int = 0, **options):
+    """Run a simulator until killed, reporting the bound port through port_queue"""
+    server = SimulatorServer(JobBoardSimulator(jobs, companies, page_size, seed),
+                             host=host, port=port, **options)
+    if port_queue is not None:
+        port_queue.put(server.server_address[1])
+    print(f"Simulated job board with {jobs} jobs on {server.url}", file=sys.stderr)
+    server.serve_forever()
+
+
+def add_simulator_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--companies', type=int, default=100)
+    parser.add_argument('--page-size', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help='mean seconds per request')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of 500 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of 429 responses')
+    parser.add_argument('--retry-after', type=float, default=1.0)
+
+
+def simulator_options(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        'jobs': args.jobs, 'companies': args.companies, 'page_size': args.page_size,
+        'seed': args.seed, 'latency': args.latency, 'error_rate': args.error_rate,
+        'rate_limit_rate': args.rate_limit_rate, 'retry_after': args.retry_after,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Serve a simulated Workable-like job board')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    add_simulator_arguments(parser)
+    args = parser.parse_args(argv)
+    serve(host=args.host, port=args.port, **simulator_options(args))
+
+
+if __name__ == '__main__':
+    main()
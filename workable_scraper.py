@@ -2,24 +2,114 @@
 import json
 import time
 import datetime
-from typing import List, Dict, Any
+import re
+from urllib.parse import urlsplit, urlencode, urljoin
+from typing import List, Dict, Any, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
+from lxml import html as lxml_html
 
 from core.base_scraper import BasePlatformScraper
+from core.models import Job
+from core.page_cache import CacheMissError
+
+# Job overview fields of a detail page, read as text
+JOB_OVERVIEW_XPATHS = {
+    'title': "//h2[contains(@class, 'jobOverview__job-title')]//strong",
+    'company': "//h3[contains(@class, 'jobOverview__company')]//a",
+    'workplace': "//span[@data-ui='overview-workplace']//strong",
+    'job_type': "//span[@data-ui='overview-employment-type']",
+    'location': "//span[@data-ui='overview-location']",
+    'posted': "//span[@data-ui='overview-date-posted']",
+}
+
+# Company fields of a detail page, read from an attribute
+COMPANY_XPATHS = {
+    'company_url': ("//h3[contains(@class, 'jobOverview__company')]//a", 'href'),
+    'company_logo': ("//div[@class='companyLogo__container--26Pxz']//img[contains(@class, 'companyLogo__logo')]", 'src'),
+}
+
+
+# Fields of a job card in the listings, read as text
+JOB_CARD_XPATHS = {
+    'title': ".//*[@data-ui='job-title']",
+    'company': ".//*[@data-ui='job-company']",
+    'location': ".//*[@data-ui='job-location']",
+    'job_type': ".//*[@data-ui='job-type']",
+    'workplace': ".//*[@data-ui='job-workplace']",
+    'posted': ".//*[@data-ui='job-posted']",
+}
+
+# Reads every card from arguments[1] on in one round trip: their text
+# fields (XPaths in arguments[2]) and link
+LISTING_PAGE_SCRIPT = """
+const cards = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const records = [];
+for (let i = arguments[1]; i < cards.snapshotLength; i++) {
+  const card = cards.snapshotItem(i);
+  const record = {};
+  for (const [field, xpath] of Object.entries(arguments[2])) {
+    const node = document.evaluate(xpath, card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    record[field] = node ? node.textContent.trim().replace(/\\s+/g, ' ') : null;
+  }
+  const link = card.querySelector('a[href]');
+  record.url = link ? link.href : null;
+  records.push(record);
+}
+return records;
+"""
+
+# Job id in a jobs.workable.com/view/<id> URL
+JOB_ID_PATTERN = re.compile(r'/view/([^/?#]+)')
+
+# Description headings and labels that introduce the salary
+SALARY_LABEL_RE = re.compile(r'(?:salary|compensation|pay|remuneration)(?:\s+range)?', re.IGNORECASE)
+
+# Search params understood by jobs.workable.com, mapped to their query parameters
+SEARCH_QUERY_PARAMS = {
+    'query': 'query',
+    'location': 'location',
+    'workplace': 'workplace',
+    'employment_type': 'employment_type',
+}
+
+# Total result count shown above the listings, e.g. "1,284 jobs"
+JOBS_COUNT_XPATH = "//span[@data-ui='jobs-list-title']//strong"
+
+# Public JSON job board of a Workable account, descriptions included
+BOARD_API_URL = "https://apply.workable.com/api/v1/widget/accounts/{account}?details=true"
+
+# Job list items on jobs.workable.com searches and on apply.workable.com company boards
+JOB_LIST_ITEM_XPATH = "//li[@class='jobsList__list-item--3HLIF'] | //li[@data-ui='job']"
+
 
 class WorkableScraper(BasePlatformScraper):
     """oop optimized workable scraper"""
 
     def __init__(self):
         super().__init__("workable")
-        self.base_url = "https://jobs.workable.com/search?location=Lagos%2C+Nigeria"
+        self.base_url = "https://jobs.workable.com/search"
+        # Used when a search sets none of the SEARCH_QUERY_PARAMS
+        self.default_search = {'location': 'Lagos, Nigeria'}
+        self.board_api_url = BOARD_API_URL
+        # Searches only page through this many results, see SearchPlanner
+        self.result_cap = 1000
+        self.results_per_page = 10
+        # Exhaustive values a search can be split on, in splitting order
+        self.shard_dimensions = [
+            ('employment_type', ['full_time', 'part_time', 'contract', 'temporary', 'internship', 'other']),
+            ('workplace', ['on_site', 'hybrid', 'remote']),
+        ]
         self.wait = None
         self.current_page = 0
+        # Listings already returned by get_job_elements on the current page
+        self.listed = 0
+        # Job details open in their own tab so the listings keep their state
+        self._detail_window = None
 
     
     def setup_driver(self) -> None:
@@ -31,26 +121,34 @@ class WorkableScraper(BasePlatformScraper):
 
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 10)
+        self._detail_window = None
 
     
     def get_job_listings_page(self, search_params: Dict[str, Any]) -> None:
         """Navigate to job listings page"""
         url = self._build_search_url(search_params)
         print(f"Navigating to: {url}")
+        self.listed = 0
+        self.current_page = 0
+        # Not through the page cache: the listing grows in place through
+        # "Show more", which a cached copy without its scripts cannot do
         self.driver.get(url)
         self._handle_cookie_consent()
         time.sleep(2) # allowing page load 
 
     def get_job_elements(self) -> List[Any]:
-        """Get all job elements currently visible on page"""
+        """Get the job elements added to the page since the last call
+
+        'Show more' appends to the same list, so earlier listings are skipped.
+        """
         try:
             # Wait for job listings to load
             self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//li[@class='jobsList__list-item--3HLIF']"))
+                EC.presence_of_element_located((By.XPATH, JOB_LIST_ITEM_XPATH))
             )
             
-            # Return ALL job elements on current page
-            listings = self.driver.find_elements(By.XPATH, "//li[@class='jobsList__list-item--3HLIF']")
+            listings = self.driver.find_elements(By.XPATH, JOB_LIST_ITEM_XPATH)[self.listed:]
+            self.listed += len(listings)
             print(f"Found {len(listings)} job listings on page")
             return listings
             
@@ -59,68 +157,378 @@ class WorkableScraper(BasePlatformScraper):
             return []
         
     
-    def extract_basic_job_info(self, job_element: Any) -> Dict[str, Any]:
+    def extract_basic_job_info(self, job_element: Any) -> Job:
         """Extract Only basic info visible in the job listing"""
-        job_info = {
-            'platform': self.platform_name,
-            'title': 'Not found',
-            'company': 'Not found',
-            'location': 'Not found',
-            'job_type': 'Not found',
-            'salary': 'Not found',
-            'url': 'Not found',
-            'post_date': 'Not found',
-            'raw_data': {}
-        }
+        job = Job(platform=self.platform_name)
 
         try:
-            pass
             # Extract whats visible without clicking
-            # title_elem = 
-            # job_info['title] = title_elem.text.strip() if title_elem else 'Not found'
+            record = {}
+            for field, xpath in JOB_CARD_XPATHS.items():
+                elements = job_element.find_elements(By.XPATH, xpath)
+                if elements and elements[0].text.strip():
+                    record[field] = elements[0].text.strip()
 
-            # job_link = 
-            # job_info['url'] = job_link.get_attribute('href') if job_link else 'Not found'
+            job_link = job_element.find_element(By.XPATH, ".//a[@href]")
+            record['url'] = job_link.get_attribute('href')
+            return self._listing_job(record)
 
         except NoSuchElementException as e:
             print(f"Error extracting basic info: {e}")
-            job_info['raw_data']['error'] = str(e)
+            job.raw_data['error'] = str(e)
+
+        return job
 
-        return job_info
+    def extract_listing_page(self) -> List[Job]:
+        """Basic info of every new card on the page, read with a single script call"""
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.XPATH, JOB_LIST_ITEM_XPATH))
+            )
+        except TimeoutException:
+            print("No job listings found")
+            return []
+
+        records = self.driver.execute_script(LISTING_PAGE_SCRIPT, JOB_LIST_ITEM_XPATH,
+                                             self.listed, JOB_CARD_XPATHS)
+        self.listed += len(records)
+        print(f"Found {len(records)} job listings on page")
+        return [self._listing_job(record) for record in records]
+
+    def _listing_job(self, record: Dict[str, Any]) -> Job:
+        """Job from a card record of LISTING_PAGE_SCRIPT"""
+        job = Job(platform=self.platform_name)
+        job.update({field: value for field, value in record.items() if value})
+
+        # workplace and posted are kept in raw_data by Job.update
+        if job.raw_data.get('posted'):
+            job.post_date = _parse_post_date(job.raw_data['posted'])
+        match = JOB_ID_PATTERN.search(job.url or '')
+        if match:
+            job.raw_data['job_id'] = match.group(1)
+        return job
     
 
     def extract_detailed_job_info(self, job_url: str) -> Dict[str, Any]:
         """Navigate to job url and extract detailed information"""
         detailed_info = {
-            'description': 'Not found',
-            'requirements': 'Not found'
+            'description': None,
+            'requirements': None
         }
 
-        if not job_url or job_url == 'Not found':
+        if not job_url:
             return detailed_info
         
+        listing_window = self.driver.current_window_handle
         try:
-            # navigate to the speecific page
-            self.driver.get(job_url)
-
-            # Wait for job details to load
-            self.wait.until(
+            # navigate to the speecific page, waiting for job details to load
+            self._switch_to_detail_window()
+            self.open_page(job_url, ready=lambda: self.wait.until(
                 EC.presence_of_element_located((By.XPATH, "//h2[contains(@class, 'jobOverview__job-title')]"))
-            )
+            ), archive=True)
 
-            # Extract detailed information
-            description_data = self._get_job_description()
-            if description_data:
-                detailed_info['description'] = description_data
-                detailed_info['requirements'] = self._extract_requirements_from_description(description_data)
+            # One page_source round trip instead of a WebDriver call per element
+            page_info = self.parse_detail_page(self.driver.page_source, job_url)
 
-            
-            # Extract other details like salary, benefits etc
-            detailed_info.update(self._extract_job_metadata())
+            # Description, requirements and the job overview: company, location, type etc
+            if not page_info['description']:
+                page_info.pop('description')
+            detailed_info.update(page_info)
+
+        except CacheMissError:
+            raise
 
         except Exception as e:
             print(f"Error extracting detailed info from {job_url}: {e}")
             detailed_info['description'] = f"Error: {str(e)}"
+
+        finally:
+            self.driver.switch_to.window(listing_window)
         
         return detailed_info
-    
\ No newline at end of file
+
+    def _switch_to_detail_window(self) -> None:
+        """Switch to the tab job details are opened in, creating it once"""
+        if self._detail_window is None:
+            self.driver.switch_to.new_window('tab')
+            self._detail_window = self.driver.current_window_handle
+        else:
+            self.driver.switch_to.window(self._detail_window)
+    
+    def _extract_requirements_from_description(self, description_data: Dict[str, Any]) -> List[str]:
+        """Flatten the Requirements section into a list of requirement lines"""
+        requirements = []
+        for entry in description_data.get('requirements', []):
+            if 'items' in entry:
+                requirements.extend(entry['items'])
+            elif entry.get('content'):
+                requirements.append(entry['content'])
+        return requirements
+
+    def _extract_salary_from_description(self, description_data: Dict[str, Any]) -> Optional[str]:
+        """Salary text of a description: the entry after a 'Salary' heading, or a 'Salary: ...' line"""
+        for entries in description_data.values():
+            for i, entry in enumerate(entries):
+                text = entry.get('content') or ''
+                label, _, value = text.partition(':')
+                if SALARY_LABEL_RE.fullmatch(label.strip()):
+                    if value.strip():
+                        return value.strip()
+                    if i + 1 < len(entries):
+                        following = entries[i + 1]
+                        return following.get('content') or next(iter(following.get('items', [])), None)
+        return None
+
+    def has_next_page(self) -> bool:
+        """Check for the 'Show more' button below the listings"""
+        return bool(self.driver.find_elements(By.XPATH, "//button[@data-ui='load-more-button']"))
+
+    def go_to_next_page(self) -> bool:
+        """Load the next batch of listings with the 'Show more' button"""
+        try:
+            self.driver.find_element(By.XPATH, "//button[@data-ui='load-more-button']").click()
+            # Wait for the new listings instead of a fixed sleep
+            self.wait.until(
+                lambda driver: len(driver.find_elements(By.XPATH, JOB_LIST_ITEM_XPATH)) > self.listed
+            )
+            self.current_page += 1
+            return True
+        except NoSuchElementException:
+            print("Show more not found")
+            return False
+        except TimeoutException:
+            print("No new listings after Show more")
+            return False
+
+    def _build_search_url(self, search_params: Dict[str, Any]) -> str:
+        """Build the listings URL for a search
+
+        A company_url points the scrape at that company's own board.
+        """
+        if search_params.get('company_url'):
+            return search_params['company_url']
+
+        search_params = self.effective_search_params(search_params)
+        query = {name: search_params[key] for key, name in SEARCH_QUERY_PARAMS.items()
+                 if search_params.get(key)}
+        return f"{self.base_url}?{urlencode(query)}"
+
+    def effective_search_params(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """The search actually run: default_search when no search param is set"""
+        if search_params.get('company_url') or any(search_params.get(key) for key in SEARCH_QUERY_PARAMS):
+            return dict(search_params)
+        return {**search_params, **self.default_search}
+
+    def count_results(self, search_params: Dict[str, Any]) -> Optional[int]:
+        """Open a search and read its total result count"""
+        self.get_job_listings_page(search_params)
+        elements = self.driver.find_elements(By.XPATH, JOBS_COUNT_XPATH)
+        if elements:
+            match = re.search(r'[\d,]+', elements[0].text)
+            if match:
+                return int(match.group().replace(',', ''))
+        # No count shown: an empty search has no listings either
+        if not self.driver.find_elements(By.XPATH, JOB_LIST_ITEM_XPATH):
+            return 0
+        return None
+
+    def company_board_url(self, company_url: str) -> str:
+        """JSON board URL of an apply.workable.com/<account> or <account>.workable.com URL"""
+        parts = urlsplit(company_url if '//' in company_url else '//' + company_url)
+        host = (parts.hostname or '').lower()
+        account = None
+        if host == 'apply.workable.com':
+            account = parts.path.strip('/').split('/')[0]
+        elif host.endswith('.workable.com') and host.count('.') == 2:
+            account = host.split('.')[0]
+            if account in ('www', 'jobs', 'apply'):
+                account = None
+
+        if not account:
+            raise ValueError(f"Not a Workable company board: {company_url}")
+        return self.board_api_url.format(account=account)
+
+    def parse_company_board(self, body: str, company_url: str) -> List[Job]:
+        """Turn a Workable widget API response into Job records"""
+        data = json.loads(body)
+        company = data.get('name')
+        jobs = []
+
+        for item in data.get('jobs', []):
+            url = item.get('url') or item.get('shortlink')
+            if not url:
+                continue
+
+            location = ', '.join(part for part in (item.get('city'), item.get('state'), item.get('country')) if part)
+            if item.get('telecommuting'):
+                location = f"{location} (Remote)" if location else 'Remote'
+
+            description = {
+                'main_description': self._parse_html_entries(item.get('description')),
+                'requirements': self._parse_html_entries(item.get('requirements')),
+                'benefits': self._parse_html_entries(item.get('benefits')),
+            }
+
+            job = Job(
+                platform=self.platform_name,
+                url=url,
+                title=item.get('title'),
+                company=company,
+                location=location or None,
+                job_type=item.get('employment_type') or None,
+                description=description,
+                requirements=self._extract_requirements_from_description(description),
+                salary=self._extract_salary_from_description(description),
+                post_date=_format_iso_date(item.get('published_on') or item.get('created_at')),
+                company_url=company_url,
+            )
+            job.raw_data['shortcode'] = item.get('shortcode')
+            job.raw_data['department'] = item.get('department')
+            jobs.append(job)
+
+        return jobs
+
+    def _parse_html_entries(self, fragment: str) -> List[Dict[str, Any]]:
+        """Section entries of an HTML fragment, as _parse_section_entries collects them"""
+        entries = []
+        if fragment:
+            self._parse_section_entries(lxml_html.fragment_fromstring(fragment, create_parent='div'), entries)
+        return entries
+
+    def _handle_cookie_consent(self) -> None:
+        """Accept the cookie banner if it is shown"""
+        try:
+            self.driver.find_element(By.XPATH, "//button[@data-ui='cookie-consent-accept']").click()
+            time.sleep(1)
+        except NoSuchElementException:
+            pass
+
+    def parse_detail_page(self, html: str, url: Optional[str] = None) -> Dict[str, Any]:
+        """Extract detail fields from the raw HTML of a job page
+
+        url is the address the page was loaded from, used to make the
+        company link and logo absolute.
+        """
+        tree = lxml_html.fromstring(html)
+        page_info = self._parse_job_metadata(tree, url)
+        page_info['description'] = self._parse_description(tree)
+        if page_info['description']:
+            page_info['requirements'] = self._extract_requirements_from_description(page_info['description'])
+            salary = self._extract_salary_from_description(page_info['description'])
+            if salary:
+                page_info['salary'] = salary
+        return page_info
+
+    def _parse_job_metadata(self, tree: Any, url: Optional[str] = None) -> Dict[str, Any]:
+        """Extract the job overview fields of a parsed page"""
+        metadata = {}
+        for field, xpath in JOB_OVERVIEW_XPATHS.items():
+            elements = tree.xpath(xpath)
+            if elements:
+                metadata[field] = _text(elements[0])
+
+        if 'posted' in metadata:
+            metadata['post_date'] = _parse_post_date(metadata['posted'])
+
+        # Company details are the same on every job of the company, skip
+        # them while the company cache still holds a fresh copy
+        company = metadata.get('company')
+        if company and self.company_cache and self.company_cache.is_fresh(self.platform_name, company):
+            return metadata
+
+        for field, (xpath, attribute) in COMPANY_XPATHS.items():
+            elements = tree.xpath(xpath)
+            if elements and elements[0].get(attribute):
+                value = elements[0].get(attribute)
+                metadata[field] = urljoin(url, value) if url else value
+
+        return metadata
+
+    def _parse_description(self, tree: Any) -> Dict[str, Any]:
+        """Collect the Description, Requirements and Benefits sections of a parsed page"""
+        description_data = {
+            'main_description': [],
+            'requirements': [],
+            'benefits': []
+        }
+
+        job_divs = tree.xpath("//div[@class='jobBreakdown__job-breakdown--31MGR']")
+        if not job_divs:
+            return description_data
+
+        for section in job_divs[0].iter('section'):
+            heading = section.find('.//h3')
+            content_divs = section.xpath(
+                ".//*[contains(concat(' ', normalize-space(@class), ' '), ' parsedHtml__content--OWD2W ')]"
+            )
+            if heading is None or not content_divs:
+                continue
+
+            heading = _text(heading)
+            if "Requirements" in heading:
+                entries = description_data['requirements']
+            elif "Benefits" in heading:
+                entries = description_data['benefits']
+            elif "Description" in heading:
+                entries = description_data['main_description']
+            else:
+                continue
+
+            self._parse_section_entries(content_divs[0], entries)
+
+        return description_data
+
+    def _parse_section_entries(self, content_div: Any, entries: List[Dict[str, Any]]) -> None:
+        """Collect paragraphs, subheadings and lists of a section content div"""
+        for p in content_div.iter('p'):
+            strong_elements = list(p.iter('strong'))
+            if strong_elements:
+                for strong in strong_elements:
+                    text = _text(strong)
+                    if text:
+                        entries.append({'type': 'sub_title', 'content': text})
+            else:
+                text = _text(p)
+                if text:
+                    entries.append({'type': 'paragraph', 'content': text})
+
+        for h in content_div.iter('h3'):
+            text = _text(h)
+            if text:
+                entries.append({'type': 'subheading', 'content': text})
+
+        for tag, list_type in (('ul', 'unordered_list'), ('ol', 'ordered_list')):
+            for list_elem in content_div.iter(tag):
+                items = [_text(item) for item in list_elem.iter('li')]
+                items = [item for item in items if item]
+                if items:
+                    entries.append({'type': list_type, 'items': items})
+
+
+def _parse_post_date(posted: str) -> str:
+    """Turn 'Posted 3 days ago' style text into a dd/mm/YYYY date"""
+    today = datetime.datetime.today()
+    parts = posted.split()
+
+    # Format: "Posted X day/days/month/months/year/years ago"
+    if len(parts) >= 3 and parts[0].lower() == "posted" and parts[1].isdigit():
+        days_per_unit = {'day': 1, 'days': 1, 'month': 30, 'months': 30, 'year': 365, 'years': 365}
+        if parts[2] in days_per_unit:
+            post_date = today - datetime.timedelta(days=int(parts[1]) * days_per_unit[parts[2]])
+            return post_date.strftime('%d/%m/%Y')
+
+    # "Posted today" and anything unrecognised fall back to today's date
+    return today.strftime('%d/%m/%Y')
+
+
+def _format_iso_date(value: str) -> str:
+    """Turn a 'YYYY-MM-DD...' API date into the dd/mm/YYYY format used for post dates"""
+    try:
+        return datetime.datetime.strptime(value[:10], '%Y-%m-%d').strftime('%d/%m/%Y')
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(element: Any) -> str:
+    """Whitespace-normalized text of an lxml element, like WebElement.text"""
+    return ' '.join(element.text_content().split())